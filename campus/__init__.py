@@ -1,9 +1,29 @@
 """campus - A Python wrapper for the Campus API."""
 
-from .api import CampusClient, get_client
+import functools
+from typing import Mapping
+
+from . import config
+from .api import CampusClient
 
 
 __all__ = [
     "CampusClient",
     "get_client",
 ]
+
+
+@functools.cache
+def _client_for(items: frozenset) -> CampusClient:
+    """Create a CampusClient for the given config items, once per config."""
+    return CampusClient.from_config(dict(items))
+
+
+def get_client(cfg: Mapping | None = None, **kwargs) -> CampusClient:
+    """Get a CampusClient instance.
+
+    Clients are shared: calls with the same config return the same client.
+    """
+    items = dict(cfg) if cfg else dict(config.default)
+    items.update(kwargs)
+    return _client_for(frozenset(items.items()))
@@ -7,10 +7,16 @@ Campus resources are represented through the CampusClient class, with
 each resource represented as an attribute.
 """
 
+from typing import Awaitable, TypeVar
+
 from campus.api.base import CampusAPI
 from campus.api.clients import Clients
 from campus.api.users import Users
 
+from . import http, http_async
+
+T = TypeVar("T")
+
 
 class CampusClient(CampusAPI):
     """The Campus API client.
@@ -32,3 +38,31 @@ class CampusClient(CampusAPI):
         base_url = config.get("base_url", "https://api.campus.nyjc.dev")
         version = config.get("version", "v1")
         return cls(base_url, version)
+
+    def gather(self, *coros: Awaitable[T]) -> list[T]:
+        """Run async API calls concurrently and return their results in order.
+
+        The calls run in their own event loop, so this cannot be called
+        from a coroutine; use asyncio.gather() there instead.
+
+        Example:
+            client.gather(*(circle.aget() for circle in circles))
+        """
+        return http_async.run(http_async.gather(*coros))
+
+    def close(self) -> None:
+        """Close the pooled connections used for API calls.
+
+        Connections are pooled per process and shared by all clients, so
+        this releases them for every CampusClient, not just this one. It
+        is meant for shutdown; clients remain usable afterwards, and open
+        new connections as needed.
+        """
+        http.close()
+        http_async.close()
+
+    def __enter__(self) -> "CampusClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
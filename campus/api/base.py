@@ -2,9 +2,11 @@
 
 Base classes and types for Campus Python API.
 """
+import functools
 import logging
 import re
-from typing import Callable, Protocol
+import sys
+from typing import Callable, NewType, Protocol
 
 from campus.schema.datatypes import UserID, CampusID
 
@@ -19,37 +21,73 @@ VersionPattern = re.compile(r"^v\d+$")
 
 URL_SEP = "/"
 
+logger = logging.getLogger(__name__)
+
+
+# Clients are created with the same base URL and version over and over,
+# so validation results are cached
+@functools.lru_cache(maxsize=1024)
+def _valid_base_url(value: str) -> bool:
+    """Check if the value is a valid base URL, caching the result.
+
+    This is equivalent to BaseUrlPattern, but checks the host labels in
+    a single linear pass; the pattern's nested quantifiers backtrack on
+    long invalid hosts.
+    """
+    for scheme in ("https://", "http://"):
+        if value.startswith(scheme):
+            value = value[len(scheme):]
+            break
+    host, _, path = value.partition(URL_SEP)
+    if "\n" in path:
+        return False
+    *labels, tld = host.split(".")
+    return (
+        bool(labels)
+        and len(tld) >= 2
+        and tld.isascii()
+        and tld.isalpha()
+        and all(
+            label and label.isascii() and label.replace("-", "a").isalnum()
+            for label in labels
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _valid_version(value: str) -> bool:
+    """Check if the value is a valid version, caching the result."""
+    return VersionPattern.fullmatch(value) is not None
+
 
 def log_error(error: dict, path: str, method: str) -> None:
-    log_str = f"{method.upper()} {path} - {error['error_code']}"
-    logging.error(log_str)
+    logger.error("%s %s - %s", method.upper(), path, error['error_code'])
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if error['message']:
-        logging.info(f"Message: {error['message']}")
+        logger.info("Message: %s", error['message'])
     if error['details']:
-        logging.info(f"Details: {error['details']}")
+        logger.info("Details: %s", error['details'])
 
 
-class BaseUrl(str):
-    """A class representing a base URL.
+# Base URLs and versions are plain (interned) strings at runtime; the
+# NewTypes only mark them for type checking
+BaseUrl = NewType("BaseUrl", str)
+Version = NewType("Version", str)
 
-    This class is used to validate and represent a base URL.
-    """
 
-    def __new__(cls, value: str):
-        if not BaseUrlPattern.match(value):
-            raise ValueError(f"Invalid base URL: {value}")
-        return super().__new__(cls, value)
+def _as_base_url(value: str) -> BaseUrl:
+    """Validate the base URL, returning it as an interned string."""
+    if not _valid_base_url(value):
+        raise ValueError(f"Invalid base URL: {value}")
+    return BaseUrl(sys.intern(value))
 
-class Version(str):
-    """A class representing a version.
 
-    This class is used to validate and represent a version.
-    """
-
-    def __new__(cls, value: str):
-        if not VersionPattern.match(value):
-            raise ValueError(f"Invalid version: {value}")
-        return super().__new__(cls, value)
+def _as_version(value: str) -> Version:
+    """Validate the version, returning it as an interned string."""
+    if not _valid_version(value):
+        raise ValueError(f"Invalid version: {value}")
+    return Version(sys.intern(value))
 
 
 class Pathable(Protocol):
@@ -58,6 +96,7 @@ class Pathable(Protocol):
     This protocol is used to define the interface for objects that can
     be converted to a path.
     """
+    __slots__ = ()
 
     def build_path(self, *args, **kwargs) -> str:
         """Convert the object to a string."""
@@ -76,17 +115,23 @@ class CampusAPI(Pathable):
             *args,
             **kwargs
     ):
-        self.base_url = BaseUrl(base_url)
-        self.version = Version(version)
+        self.base_url = _as_base_url(base_url)
+        self.version = _as_version(version)
         self.on_error = on_error
         self.last_error = None
+        # Every resource path starts with this, so a single copy is kept
+        self._path_prefix = sys.intern(f"{self.base_url}{URL_SEP}{self.version}")
         
     def build_path(self, *args: str) -> str:
         """Build a path for the API.
 
         This method is used to build a path for the API call.
         """
-        return URL_SEP.join([self.base_url, self.version, *args])
+        if not args:
+            return self._path_prefix
+        if len(args) == 1:
+            return f"{self._path_prefix}{URL_SEP}{args[0]}"
+        return URL_SEP.join([self._path_prefix, *args])
     
     def handle_error(self, error: dict, path: str, method: str) -> None:
         """Handle an error response from the API.
@@ -102,9 +147,14 @@ class CampusResource(Pathable):
 
     This class provides a common interface for all resources.
     """
+    __slots__ = ("parent", "_root", "_path_prefix")
 
     def __init__(self, parent: "CampusAPI | CampusResource"):
         self.parent = parent
+        # The parent does not change, so the root and absolute path are
+        # found once here
+        self._root = parent if isinstance(parent, CampusAPI) else parent._root
+        self._path_prefix = parent.build_path()
     
     @property
     def root(self) -> CampusAPI:
@@ -112,9 +162,7 @@ class CampusResource(Pathable):
 
         This method is used to get the root of the resource tree.
         """
-        if isinstance(self.parent, CampusAPI):
-            return self.parent
-        return self.parent.root
+        return self._root
 
     def __repr__(self):
         return f"<{self.__class__.__name__}>"
@@ -124,7 +172,11 @@ class CampusResource(Pathable):
 
         This method is used to build a path for the resource.
         """
-        return "/".join([self.parent.build_path(), *args])
+        if not args:
+            return self._path_prefix
+        if len(args) == 1:
+            return f"{self._path_prefix}{URL_SEP}{args[0]}"
+        return URL_SEP.join([self._path_prefix, *args])
 
 
 class SingleResource(CampusResource):
@@ -133,10 +185,12 @@ class SingleResource(CampusResource):
     This class provides a common interface for all single resources,
     including methods for creating, updating, and deleting resources.
     """
+    __slots__ = ("id",)
 
     def __init__(self, parent: CampusResource, id: CampusID | UserID):
         super().__init__(parent)
         self.id = id
+        self._path_prefix = f"{self._path_prefix}{URL_SEP}{id}"
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id}>"
@@ -148,3 +202,10 @@ class ResourceCollection(CampusResource):
     This class provides a common interface for all resources, including
     methods for creating, updating, and deleting resources.
     """
+    __slots__ = ()
+    # The path segment of the collection, e.g. "users"
+    name: str
+
+    def __init__(self, parent: "CampusAPI | CampusResource"):
+        super().__init__(parent)
+        self._path_prefix = f"{self._path_prefix}{URL_SEP}{self.name}"
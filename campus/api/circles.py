@@ -3,15 +3,18 @@
 Represents operations on the circles resource in Campus.
 """
 
+from typing import Iterator
+
 from campus.schema.datatypes import CircleID, Validatable
 from campus.schema.modeltypes import Circle as CircleModel
 from campus.api.base import SingleResource, ResourceCollection
 
-from . import http
+from . import http, http_async
 
 
 class CircleMembers:
     """Represents operations on circle members."""
+    __slots__ = ("circle",)
 
     def __init__(self, circle: "Circle"):
         self.circle = circle
@@ -21,6 +24,25 @@ class CircleMembers:
         api_path = self.circle.build_path('members')
         return http.get(api_path)
 
+    def iter_members(self) -> Iterator[tuple[str, http.JsonSerializable]]:
+        """Iterate over member IDs of a circle and their access values,
+        without loading the whole member list first.
+
+        If the request fails, the error is handled by the client and
+        nothing is yielded.
+        """
+        api_path = self.circle.build_path('members')
+        resp = http.get_stream(api_path)
+        if isinstance(resp, dict):
+            self.circle.root.handle_error(resp, api_path, 'GET')
+            return iter(())
+        return resp
+
+    async def alist(self) -> dict:
+        """Get member IDs of a circle and their access values (async)."""
+        api_path = self.circle.build_path('members')
+        return await http_async.get(api_path)
+
     def add(self, **kwargs: Validatable) -> http.JsonSerializable:
         """Add a member to a circle."""
         api_path = self.circle.build_path('members/add')
@@ -39,10 +61,18 @@ class CircleMembers:
 
 class Circle(SingleResource):
     """Represents operations on a single circle resource in Campus."""
+    __slots__ = ("_members",)
+
+    def __init__(self, parent: ResourceCollection, id: CircleID):
+        super().__init__(parent, id)
+        self._members: CircleMembers | None = None
 
     @property
     def members(self) -> CircleMembers:
-        return CircleMembers(self)
+        # Created on first use and kept, as cached_property needs a __dict__
+        if self._members is None:
+            self._members = CircleMembers(self)
+        return self._members
 
     def delete(self) -> http.JsonSerializable:
         """.circles[{circle_id}].delete()"""
@@ -53,10 +83,19 @@ class Circle(SingleResource):
         """.circles[{circle_id}].get()"""
         api_path = self.build_path()
         resp_json = http.get(api_path)
-        if 'error_code' in resp_json:
+        if not isinstance(resp_json, dict) or resp_json.get('error_code'):
+            self.root.handle_error(resp_json, api_path, 'GET')
+        else:
+            return CircleModel.from_dict(resp_json)
+
+    async def aget(self) -> CircleModel | None:
+        """.circles[{circle_id}].aget()"""
+        api_path = self.build_path()
+        resp_json = await http_async.get(api_path)
+        if not isinstance(resp_json, dict) or resp_json.get('error_code'):
             self.root.handle_error(resp_json, api_path, 'GET')
         else:
-            return CircleModel(**resp_json)
+            return CircleModel.from_dict(resp_json)
 
     def update(self, **kwargs: Validatable) -> http.JsonSerializable:
         """.circles[{circle_id}].update(...)"""
@@ -79,6 +118,8 @@ class Circle(SingleResource):
 
 class Circles(ResourceCollection):
     """Represents operations on circles in Campus."""
+    __slots__ = ()
+    name = "circles"
 
     def __getitem__(self, circle_id: str) -> Circle:
         """.circles[{circle_id}]"""
@@ -91,5 +132,5 @@ class Circles(ResourceCollection):
         api_path = self.build_path()
         resp = http.post(api_path, data=circle.as_json())
         # The server returns the created resource as JSON
-        return CircleModel(**resp)
+        return CircleModel.from_dict(resp)
 
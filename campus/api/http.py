@@ -4,12 +4,74 @@ Implements HTTP calls for the Campus API.
 """
 
 import logging
-from typing import Callable
+import time
+from typing import Callable, Iterator, Literal
+
+try:
+    import orjson as _json
+    # Keys may be str subclasses such as CampusID, or not strings at all;
+    # the json module accepts both, but orjson only with OPT_NON_STR_KEYS
+    _DUMPS_KWARGS = {"option": _json.OPT_NON_STR_KEYS}
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _json
+    _DUMPS_KWARGS = {}
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import JsonSerializable
 
+# Statuses for which the server is temporarily unavailable; these requests
+# are retried, and GETs fall back to a cached response
+_UNAVAILABLE = frozenset({502, 503, 504})
+
+# A shared session reuses pooled connections (HTTP keep-alive) across calls,
+# so only the first request to a host pays for the TCP/TLS handshake.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # Once retries run out, the last response is returned rather than
+    # raised, so it becomes the usual error dict
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=_UNAVAILABLE,
+        raise_on_status=False,
+    ),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+logger = logging.getLogger(__name__)
+
+CachePolicy = Literal["short", "normal", "long", "none"]
+
+# Seconds for which a cached GET response is reused without refetching
+_TTL: dict[CachePolicy, float] = {
+    "short": 5.0,
+    "normal": 10.0,
+    "long": 30.0,
+    "none": 0.0,
+}
+# Default cache policy by the last segment of the URL path
+_POLICY_BY_SUFFIX: dict[str, CachePolicy] = {
+    "members": "normal",
+    "users": "long",
+}
+# Last good GET response for each URL, with the time it was fetched.
+# Responses are stored encoded, and decoded afresh for each caller, so a
+# caller mutating its result cannot change what later callers get.
+_cache: dict[str, tuple[float, bytes | str]] = {}
+
 
 class HttpError(Exception):
     """Custom exception for HTTP errors."""
@@ -29,14 +91,55 @@ def _log_response(response: requests.Response) -> None:
         response (requests.Response): The response object from the API call.
     """
     _req = response.request
-    log_str = f"{_req.method} {_req.url} {response.status_code}"
-    logging.debug(log_str)
+    logger.debug("%s %s %s", _req.method, _req.url, response.status_code)
+
+
+def close() -> None:
+    """Close the shared session and release its pooled connections.
+
+    The session stays usable; later calls open new connections.
+    """
+    _session.close()
+
+
+def clear_cache() -> None:
+    """Discard all cached GET responses."""
+    _cache.clear()
+
+
+def _invalidate(url: str) -> None:
+    """Discard cached responses for the URL, the resources it is nested in,
+    and the resources nested in it.
+    """
+    stale = [key for key in _cache if key.startswith(url) or url.startswith(key)]
+    for key in stale:
+        del _cache[key]
+
+
+def _dumps(data: JsonSerializable) -> bytes | str:
+    """Serialize request data, or a response to be cached, to JSON."""
+    return _json.dumps(data, **_DUMPS_KWARGS)
+
+
+def _is_error(resp_json: JsonSerializable) -> bool:
+    """Check if the response is a Campus API error."""
+    return isinstance(resp_json, dict) and 'error_code' in resp_json
+
+
+def _error_dict(response: requests.Response) -> dict:
+    """Describe a failed response as a Campus API error."""
+    # Error bodies are often HTML error pages, so they are not decoded
+    return {
+        "error_code": response.status_code,
+        "message": response.reason,
+        "details": response.text,
+    }
 
 
 def _call_api(
         method: str,
         url: str,
-        data: dict | None,
+        data: dict | None = None,
         callback: Callable[[requests.Response], None] = _log_response,
 ) -> JsonSerializable:
     """Make an API call to the Campus API.
@@ -47,27 +150,109 @@ def _call_api(
         data (dict, optional): The data to send in the request body. Defaults to None.
 
     Returns:
-        requests.Response: The response object from the API call.
+        JsonSerializable: The JSON response from the API, or an error
+            dict with error_code, message and details if the call failed.
     """
+    if method != "GET":
+        _invalidate(url)
     response = (
-        requests.request(method, url, json=data) if data
-        else requests.request(method, url)
+        _session.request(method, url, data=_dumps(data), headers=JSON_HEADERS)
+        if data is not None
+        else _session.request(method, url)
     )
     callback(response)
-    return response.json()
+    if not response.ok:
+        return _error_dict(response)
+    return _json.loads(response.content)
 
 
-def get(url: str) -> JsonSerializable:
+def get(url: str, *, cache: CachePolicy | None = None) -> JsonSerializable:
     """Make a GET request to the Campus API.
 
+    Successful responses are cached for a time set by the cache policy.
+    If the request fails outright, or the server is still unavailable
+    after retries, the last good response is returned instead, if there
+    is one. Each call returns its own copy of the response, which the
+    caller may modify.
+
     Args:
         url (str): The URL for the API endpoint.
-        params (dict, optional): The query parameters to include in the request. Defaults to None.
+        cache (CachePolicy, optional): How long a cached response may be
+            reused. Defaults to a policy based on the resource requested.
 
     Returns:
         JsonSerializable: The JSON response from the API.
     """
-    return _call_api("GET", url, None)
+    if cache is None:
+        cache = _POLICY_BY_SUFFIX.get(url.rpartition("/")[2], "short")
+    if cache == "none":
+        return _call_api("GET", url)
+    now = time.monotonic()
+    entry = _cache.get(url)
+    if entry is not None and now - entry[0] < _TTL[cache]:
+        return _json.loads(entry[1])
+    try:
+        resp_json = _call_api("GET", url)
+    except requests.RequestException as err:
+        if entry is None:
+            raise
+        logger.warning("GET %s failed (%s), using cached response", url, err)
+        return _json.loads(entry[1])
+    if not _is_error(resp_json):
+        _cache[url] = (now, _dumps(resp_json))
+    elif entry is not None and resp_json["error_code"] in _UNAVAILABLE:
+        logger.warning(
+            "GET %s failed (%s), using cached response", url, resp_json["error_code"]
+        )
+        return _json.loads(entry[1])
+    return resp_json
+
+def get_stream(
+        url: str,
+        prefix: str = "",
+) -> Iterator[tuple[str, JsonSerializable]] | dict:
+    """Make a GET request to the Campus API, returning an iterator over the
+    key-value pairs of a JSON object in the response as they are parsed.
+
+    With ijson installed, the response body is parsed incrementally, so
+    the full response is never held in memory. Otherwise the response is
+    parsed in full before the pairs are yielded. Responses are not cached.
+
+    Args:
+        url (str): The URL for the API endpoint.
+        prefix (str, optional): Dot-separated keys of the object to
+            iterate over. Defaults to the top-level object.
+
+    Returns:
+        Iterator[tuple[str, JsonSerializable]] | dict: An iterator over
+            each key and its value, or an error dict with error_code,
+            message and details if the call failed.
+    """
+    response = _session.get(url, stream=True)
+    _log_response(response)
+    if not response.ok:
+        with response:
+            return _error_dict(response)
+    return _iter_items(response, prefix)
+
+
+def _iter_items(
+        response: requests.Response,
+        prefix: str,
+) -> Iterator[tuple[str, JsonSerializable]]:
+    """Yield the key-value pairs of the object at prefix in the response,
+    closing the response once they are exhausted.
+    """
+    with response:
+        if ijson is not None:
+            response.raw.decode_content = True
+            yield from ijson.kvitems(response.raw, prefix)
+            return
+        resp_json = _json.loads(response.content)
+    for key in filter(None, prefix.split(".")):
+        resp_json = resp_json[key]
+    yield from resp_json.items()
+
 
 def post(url: str, data: dict | None = None) -> JsonSerializable:
     """Make a POST request to the Campus API.
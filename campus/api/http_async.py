@@ -0,0 +1,176 @@
+"""campus/api/http_async
+
+Implements asynchronous HTTP calls for the Campus API.
+
+These mirror the calls in campus.api.http, so that independent requests
+(e.g. fetching several circles) can run concurrently instead of one after
+another. Requires the optional httpx dependency.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _json
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .base import JsonSerializable
+from .http import JSON_HEADERS, _dumps, _invalidate
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# An AsyncClient's connections are bound to the event loop they were
+# opened in, so each running loop gets its own client
+_clients: dict[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = {}
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """Get the running loop's client, creating it on first use."""
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for async calls; install campus[async]"
+        )
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        # Clients of loops that have since closed can no longer be used
+        for stale in [stale for stale in _clients if stale.is_closed()]:
+            del _clients[stale]
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(10.0),
+        )
+    return client
+
+
+async def aclose() -> None:
+    """Close the running loop's client and release its pooled connections."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def close() -> None:
+    """Close the clients of event loops that are not running.
+
+    Clients of a running loop are left open; await aclose() in that loop
+    to close them.
+    """
+    for loop, client in list(_clients.items()):
+        if not loop.is_closed():
+            if loop.is_running():
+                continue
+            loop.run_until_complete(client.aclose())
+        del _clients[loop]
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run the coroutine in a new event loop, as asyncio.run() does,
+    closing the loop's client once it completes.
+
+    Like asyncio.run(), this raises RuntimeError if called while an event
+    loop is already running in the thread.
+    """
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose()
+
+    return asyncio.run(main())
+
+
+async def gather(*coros: Awaitable[T], limit: int | None = None) -> list[T]:
+    """Run the given coroutines concurrently, returning results in order.
+
+    Args:
+        limit (int, optional): The most coroutines to run at once.
+            Defaults to no limit.
+    """
+    if limit is not None:
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(coro: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coro
+
+        coros = tuple(bounded(coro) for coro in coros)
+    return list(await asyncio.gather(*coros))
+
+
+def _log_response(response: "httpx.Response") -> None:
+    """Display the response from the Campus API.
+
+    Args:
+        response (httpx.Response): The response object from the API call.
+    """
+    _req = response.request
+    logger.debug("%s %s %s", _req.method, _req.url, response.status_code)
+
+
+async def _call_api(
+        method: str,
+        url: str,
+        data: dict | None = None,
+        callback: Callable[["httpx.Response"], None] = _log_response,
+) -> JsonSerializable:
+    """Make an asynchronous API call to the Campus API.
+
+    Args:
+        method (str): The HTTP method to use (GET, POST, PUT, DELETE).
+        url (str): The URL for the API endpoint.
+        data (dict, optional): The data to send in the request body. Defaults to None.
+
+    Returns:
+        JsonSerializable: The JSON response from the API, or an error
+            dict with error_code, message and details if the call failed.
+    """
+    if method != "GET":
+        # Writes make cached GET responses from campus.api.http stale
+        _invalidate(url)
+    client = _get_client()
+    response = await (
+        client.request(method, url, content=_dumps(data), headers=JSON_HEADERS)
+        if data is not None
+        else client.request(method, url)
+    )
+    callback(response)
+    if not response.is_success:
+        # Error bodies are often HTML error pages, so they are not decoded
+        return {
+            "error_code": response.status_code,
+            "message": response.reason_phrase,
+            "details": response.text,
+        }
+    return _json.loads(response.content)
+
+
+async def get(url: str) -> JsonSerializable:
+    """Make an asynchronous GET request to the Campus API."""
+    return await _call_api("GET", url)
+
+async def post(url: str, data: dict | None = None) -> JsonSerializable:
+    """Make an asynchronous POST request to the Campus API."""
+    return await _call_api("POST", url, data)
+
+async def put(url: str, data: dict | None = None) -> JsonSerializable:
+    """Make an asynchronous PUT request to the Campus API."""
+    return await _call_api("PUT", url, data)
+
+async def delete(url: str) -> JsonSerializable:
+    """Make an asynchronous DELETE request to the Campus API."""
+    return await _call_api("DELETE", url)
+
+async def patch(url: str, data: dict | None = None) -> JsonSerializable:
+    """Make an asynchronous PATCH request to the Campus API."""
+    return await _call_api("PATCH", url, data)
@@ -3,15 +3,34 @@
 Represents operations on the users resource in Campus.
 """
 
+import functools
+from typing import Iterable, Mapping
+from weakref import WeakValueDictionary
+
 from campus.schema.datatypes import UserID, Validatable
 from campus.schema.modeltypes import User as UserModel
 from campus.api.base import SingleResource, ResourceCollection
 
-from . import http
+from . import http, http_async
+
+# Most requests in flight at once for bulk operations
+BATCH_LIMIT = 32
+
+
+@functools.lru_cache(maxsize=1024)
+def _valid_user_id(value: str) -> bool:
+    """Check if the value is a valid user ID, caching the result."""
+    try:
+        UserID.validate(value)
+    except ValueError:
+        return False
+    return True
 
 
 class User(SingleResource):
     """Represents operations on a single user resource in Campus."""
+    # Users are cached weakly by their collection
+    __slots__ = ("__weakref__",)
 
     # def activate(self) -> http.JsonSerializable:
     #     """.users[{user_id}].activate()"""
@@ -27,10 +46,10 @@ class User(SingleResource):
         """.users[{user_id}].get()"""
         api_path = self.build_path()
         resp_json = http.get(api_path)
-        if 'error_code' in resp_json:
+        if not isinstance(resp_json, dict) or resp_json.get('error_code'):
             self.root.handle_error(resp_json, api_path, 'GET')
         else:
-            return UserModel(**resp_json)
+            return UserModel.from_dict(resp_json)
 
     def update(self, **kwargs: Validatable) -> http.JsonSerializable:
         """.users[{user_id}].update(...)"""
@@ -41,11 +60,23 @@ class User(SingleResource):
     
 class Users(ResourceCollection):
     """Represents operations on users in Campus."""
+    __slots__ = ("_cache",)
+    name = "users"
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        # Users in use are reused for repeated lookups of the same id
+        self._cache: WeakValueDictionary[str, User] = WeakValueDictionary()
 
     def __getitem__(self, user_id: str) -> User:
         """.users[{user_id}]"""
-        UserID.validate(user_id)
-        return User(self, UserID(user_id))
+        user = self._cache.get(user_id)
+        if user is not None:
+            return user
+        if not _valid_user_id(user_id):
+            UserID.validate(user_id)  # raises with the reason
+        user = self._cache[user_id] = User(self, UserID(user_id))
+        return user
 
     def new(self, **kwargs: Validatable) -> UserModel:
         """.users.new(...)"""
@@ -54,3 +85,53 @@ class Users(ResourceCollection):
         http.post(api_path, data=user.as_json())
         return user
 
+    def get_many(self, user_ids: Iterable[str]) -> list[UserModel | None]:
+        """.users.get_many([{user_id}, ...])
+
+        Gets the users concurrently, in one batch of requests, returning
+        None for each user that could not be fetched.
+
+        The requests run in their own event loop, so this cannot be called
+        from a coroutine; await the users' async calls there instead.
+        """
+        users = [self[user_id] for user_id in user_ids]
+        paths = [user.build_path() for user in users]
+        resps = http_async.run(http_async.gather(
+            *(http_async.get(path) for path in paths), limit=BATCH_LIMIT
+        ))
+        results = []
+        for path, resp_json in zip(paths, resps):
+            if not isinstance(resp_json, dict) or resp_json.get('error_code'):
+                self.root.handle_error(resp_json, path, 'GET')
+                results.append(None)
+            else:
+                results.append(UserModel.from_dict(resp_json))
+        return results
+
+    def new_many(
+            self,
+            items: Iterable[Mapping[str, Validatable]],
+    ) -> list[UserModel | None]:
+        """.users.new_many([{...}, ...])
+
+        Creates the users concurrently, in one batch of requests, returning
+        None for each user that could not be created. All users are
+        validated before any request is made.
+
+        The requests run in their own event loop, so this cannot be called
+        from a coroutine.
+        """
+        users = [UserModel(**item) for item in items]
+        api_path = self.build_path()
+        resps = http_async.run(http_async.gather(
+            *(http_async.post(api_path, data=user.as_json()) for user in users),
+            limit=BATCH_LIMIT,
+        ))
+        results = []
+        for user, resp_json in zip(users, resps):
+            if isinstance(resp_json, dict) and resp_json.get('error_code'):
+                self.root.handle_error(resp_json, api_path, 'POST')
+                results.append(None)
+            else:
+                results.append(user)
+        return results
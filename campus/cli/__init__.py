@@ -8,7 +8,8 @@ import sys
 from typing import Callable, Mapping, Sequence
 from warnings import warn
 
-from campus.api import CampusClient, CampusResource, get_client
+from campus import get_client
+from campus.api import CampusClient, CampusResource
 from campus.cli import pattern
 
 logging.basicConfig(level=logging.INFO)
@@ -31,8 +32,45 @@ class ParseError(Exception):
         logging.error(f"ParseError: {message}")
 
 
+def _parse_resource(resource, arg: str, params: dict) -> tuple:
+    """Descend into a sub-resource of the current resource."""
+    if not hasattr(resource, arg):
+        raise ParseError(f"Unknown resource: {arg}")
+    return getattr(resource, arg), params
+
+def _parse_campus_id(resource, arg: str, params: dict) -> tuple:
+    """Select a single resource from the current collection."""
+    if not hasattr(resource, "__getitem__"):
+        raise ParseError(f"Unexpected campus ID: {arg}")
+    return resource[arg], params
+
+def _parse_verb(resource, arg: str, params: dict) -> tuple:
+    """Select the method for a verb on the current resource."""
+    if not hasattr(resource, arg):
+        raise ParseError(f"Unexpected verb: {arg}")
+    return getattr(resource, arg), params
+
+def _parse_param_pair(resource, arg: str, params: dict) -> tuple:
+    """Add a key=value pair to the call parameters."""
+    key, value = arg.split("=", 1)
+    # TODO: value conversion
+    params[key] = value
+    return resource, params
+
+
+# Handlers for each argument token; each returns the updated
+# (resource, params) pair.
+_DISPATCH: dict[str, Callable[[object, str, dict], tuple]] = {
+    "res": _parse_resource,
+    "id": _parse_campus_id,
+    "verb": _parse_verb,
+    "kv": _parse_param_pair,
+}
+
+
 class APICall:
     """Encapsulates an API call."""
+    __slots__ = ("resource", "params", "_kind")
 
     def __init__(
             self,
@@ -43,18 +81,21 @@ class APICall:
     ):
         self.resource = resource
         self.params = params
+        # How give() treats the resource: 0 to call it, 1 to return it
+        self._kind = 0 if callable(resource) else (1 if isinstance(resource, dict) else 2)
 
     def give(self):
         """Return the API call result."""
-        if isinstance(self.resource, Callable):
+        if self._kind == 0:
             return self.resource(**self.params)
-        elif isinstance(self.resource, dict):
+        elif self._kind == 1:
             return self.resource
         raise TypeError(f"{self.resource}: Resource is not callable or dict.")
 
 
 class Parser:
     """A simple command line parser."""
+    __slots__ = ("args", "arglen", "pos")
 
     def __init__(self, args: Sequence[str]):
         self.args = args
@@ -62,8 +103,6 @@ class Parser:
         self.arglen = len(args)
         # Index of next argument to consume
         self.pos = 0
-        # List of consumed arguments
-        self.consumed = []
 
     def atEnd(self) -> bool:
         """Check if the end of the arguments is reached."""
@@ -73,14 +112,13 @@ class Parser:
         """Consume the next argument."""
         if self.pos >= self.arglen:
             raise ParseError("Incomplete command.")
-        arg = self.args[self.pos]
         self.pos += 1
-        self.consumed.append(arg)
-        return arg
+        return self.args[self.pos - 1]
     
     def current_resource(self) -> str:
         """Get the current resource path."""
-        return " ".join(self.consumed)
+        # Consumed arguments are the ones before pos
+        return SEP.join(self.args[:self.pos])
 
     def help(self) -> None:
         """Display help information."""
@@ -101,38 +139,15 @@ class Parser:
         params = {}
         while not self.atEnd():
             arg = self.consume()
-            # 1st argument is program name, 2nd argument is arg
-            if self.pos == 2:
+            token = pattern.classify(arg)
+            if token is None:
+                raise ParseError(f"Unrecognised argument: {arg}")
+            if token == "cmd":
                 # Special handling for `help` and `version`
-                if arg == 'help':
-                    self.help()
-                elif arg == 'version':
-                    self.version()
-
-            if pattern.is_resource_name(arg):
-                # Check if the resource exists
-                if not hasattr(resource, arg):
-                    raise ParseError(f"Unknown resource: {arg}")
-                resource: CampusResource = getattr(resource, arg)
-
-            elif pattern.is_campus_id(arg):
-                # Check if resource supports [] operation
-                if not hasattr(resource, "__getitem__"):
-                    raise ParseError(f"Unexpected campus ID: {arg}")
-                resource = resource[arg]  # type: ignore
-
-            elif pattern.is_campus_verb(arg):
-                # Check if the resource has a method for this verb
-                if not hasattr(resource, arg):
-                    raise ParseError(f"Unexpected verb: {arg}")
-                resource = getattr(resource, arg)
-
-            elif pattern.is_param_pair(arg):
-                key, value = arg.split("=")
-                # TODO: value conversion
-                params[key] = value
-            try:
-                resource = getattr(resource, arg)
-            except AttributeError as err:
-                raise ParseError(f"Unknown resource: {arg}") from err
-        return APICall(resource, params, path=self.consumed)
+                # 1st argument is program name, 2nd argument is arg
+                if self.pos != 2:
+                    raise ParseError(f"Unexpected command: {arg}")
+                getattr(self, arg)()
+                return None
+            resource, params = _DISPATCH[token](resource, arg, params)
+        return APICall(resource, params, path=list(self.args[:self.pos]))
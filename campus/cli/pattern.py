@@ -2,24 +2,58 @@
 
 Helper functions for parsing command arguments and calling the API.
 """
+import re
+from typing import Literal
+
+from campus.schema.datatypes import CampusID, ResourceName
+
+Token = Literal["kv", "id", "cmd", "verb", "res"]
+
+COMMANDS = frozenset({"help", "version"})
+CAMPUS_VERBS = frozenset({
+    "get", "new", "update", "delete", "add", "remove",
+    "activate", "move", "users", "members", "set",
+})
+
+ResourceNamePattern = re.compile(ResourceName)
+
+
+def classify(arg: str) -> Token | None:
+    """Classify the argument, returning None if it is not recognised.
+
+    Cheap string and set checks run before the regex checks.
+    """
+    if is_param_pair(arg):
+        return "kv"
+    if is_command(arg):
+        return "cmd"
+    if is_campus_verb(arg):
+        return "verb"
+    if is_campus_id(arg):
+        return "id"
+    if is_resource_name(arg):
+        return "res"
+    return None
 
 def is_resource_name(arg: str) -> bool:
     """Check if the argument is a valid resource name."""
-    raise NotImplementedError("is_resource_name is not implemented yet.")
+    return ResourceNamePattern.fullmatch(arg) is not None
 
 def is_campus_id(arg: str) -> bool:
     """Check if the argument is a valid Campus ID."""
-    raise NotImplementedError("is_campus_id is not implemented yet.")
+    # The prefix check rules out most arguments before the regex runs
+    return arg.startswith("uid-") and CampusID.pattern.fullmatch(arg) is not None
 
 def is_campus_verb(arg: str) -> bool:
     """Check if the argument is a valid Campus verb."""
-    raise NotImplementedError("is_campus_verb is not implemented yet.")
+    return arg in CAMPUS_VERBS
 
 def is_param_pair(arg: str) -> bool:
     """Check if the argument is a valid parameter pair."""
-    raise NotImplementedError("is_param_pair is not implemented yet.")
+    key, _, value = arg.partition("=")
+    return bool(key and value)
 
 def is_command(arg: str) -> bool:
     """Check if the argument is a valid command."""
-    raise NotImplementedError("is_command is not implemented yet.")
+    return arg in COMMANDS
 
@@ -3,10 +3,14 @@
 Configuration management for the Campus API Python wrapper.
 """
 import os
+from types import MappingProxyType
 
 from .utils import load_config
 
 DEFAULT_CONFIG_FILE = 'default.json'
 DEFAULT_CONFIG_DIR = os.path.dirname(__file__)
 
-default = load_config(os.path.join(DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILE))
+# Read-only, so callers cannot accidentally change the defaults
+default = MappingProxyType(
+    load_config(os.path.join(DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILE))
+)
@@ -2,7 +2,10 @@
 
 Utility functions for configuration management in the Campus API Python wrapper.
 """
-import json
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _json
 
 def load_config(file_path: str):
     """
@@ -14,6 +17,7 @@ def load_config(file_path: str):
     Returns:
         dict: Configuration data as a dictionary.
     """
-    with open(file_path, 'r') as file:
-        config = json.load(file)
+    # Parse the raw bytes; this skips decoding the file to str first
+    with open(file_path, 'rb') as file:
+        config = _json.loads(file.read())
     return config
@@ -4,9 +4,11 @@ Campus data types, designed for OpenAPI compatibility.
 The data types are based on native Python types as far as possible,
 and will be used to generate OpenAPI schemas for the campus API.
 """
-from datetime import datetime
+from datetime import date, datetime, time
+import functools
 import re
-from typing import Any, Literal, Protocol, runtime_checkable
+from string import ascii_letters, ascii_lowercase, digits
+from typing import Any, Callable, Literal, Protocol, Sequence
 
 # OpenAPI does not support null values, only nullable types
 JsonSerializableValues = int | float | str | bool
@@ -33,21 +35,32 @@ Base64Pattern = r'^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)
 
 # Date and time patterns as defined in RFC 3339, section 5.6 (from OpenAPI 3.0)
 YearPattern = r'\d{4}'
-MonthPattern = r'0[1-9]|1[0-2]'
-DayPattern = r'0[1-9]|[12][0-9]|3[01]'
+MonthPattern = r'(?:0[1-9]|1[0-2])'
+DayPattern = r'(?:0[1-9]|[12][0-9]|3[01])'
 DatePattern = fr'{YearPattern}-{MonthPattern}-{DayPattern}'
-HourPattern = r'0[0-9]|1[0-9]|2[0-3]'
+HourPattern = r'(?:0[0-9]|1[0-9]|2[0-3])'
 MinutePattern = r'[0-5][0-9]'
 SecondPattern = r'[0-5][0-9]'
 TimePattern = fr'{HourPattern}:{MinutePattern}:{SecondPattern}'
 DatetimePattern = fr'{DatePattern}T{TimePattern}Z'
 
 UidPrefix = Literal["uid"]
+UidPrefixPattern = r'uid'
+
+# Bytes allowed in UIDs; deleting these from a valid UID leaves nothing
+_UID_BYTES = (ascii_lowercase + digits).encode()
+# Characters allowed in user IDs and domain names
+_USER_ID_CHARS = frozenset(ascii_letters + digits + "._-")
+_DOMAIN_CHARS = frozenset(ascii_letters + digits + ".-")
 
 
-@runtime_checkable
 class Validatable(Protocol):
-    """Base class for all values requiring validation."""
+    """Base class for all values requiring validation.
+
+    The protocol is for type checking only; check the __validatable__
+    attribute at runtime instead of using isinstance().
+    """
+    __validatable__ = True
 
     def validate(self, value: Any) -> None:
         """Validate the value against the pattern, raising a ValueError if
@@ -63,6 +76,71 @@ class Validatable(Protocol):
             f"{self.__class__.__name__} does not implement as_json()"
         )
 
+
+def _is_uid8(value: str) -> bool:
+    """Check if the value is 8 lowercase letters or digits."""
+    return (
+        len(value) == 8
+        and value.isascii()
+        and value.isalnum()
+        and (value.islower() or value.isdigit())
+    )
+
+
+def is_uid8_batch(values: Sequence[str]) -> list[bool]:
+    """Check if each value is 8 lowercase letters or digits.
+
+    All values are first checked together in a single translate() pass
+    over their joined bytes; values are only checked one at a time if
+    that finds an invalid character.
+    """
+    joined = "".join(values)
+    if (
+        all(len(value) == 8 for value in values)
+        and joined.isascii()
+        and not joined.encode().translate(None, _UID_BYTES)
+    ):
+        return [True] * len(values)
+    return [_is_uid8(value) for value in values]
+
+
+@functools.cache
+def _multiline(pattern: re.Pattern) -> re.Pattern:
+    """Compile a line-anchored copy of the pattern, for matching many lines."""
+    return re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+
+
+def _is_user_id(value: str) -> bool:
+    """Check if the value is 1 to 64 letters, digits, '.', '_' or '-'."""
+    return 1 <= len(value) <= 64 and _USER_ID_CHARS.issuperset(value)
+
+
+def _is_domain(value: str) -> bool:
+    """Check if the value is a domain name ending in a top-level domain of
+    at least 2 letters.
+    """
+    name, _, tld = value.rpartition('.')
+    return (
+        bool(name)
+        and _DOMAIN_CHARS.issuperset(name)
+        and len(tld) >= 2
+        and tld.isascii()
+        and tld.isalpha()
+    )
+
+
+def _is_campus_label(value: str) -> bool:
+    """Check if the value is 1 to 3 hyphenated lowercase words."""
+    parts = value.split('-')
+    return len(parts) <= 3 and all(
+        2 <= len(part) <= 15
+        and part.isascii()
+        and part.isalpha()
+        and part.islower()
+        for part in parts
+    )
+
+
 class String(Validatable, str):
     """A typical string type."""
     
@@ -77,16 +155,74 @@ class String(Validatable, str):
         return str(self)
 
 
+class Integer(Validatable, int):
+    """A typical integer type."""
+
+    @classmethod
+    def validate(cls, value: int) -> None:
+        """Validate the integer value."""
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"Value is not an integer: {value}")
+
+    def as_json(self) -> int:
+        """Return the integer as a JSON-serialisable response."""
+        return int(self)
+
+
+class JsonObject(Validatable, dict):
+    """A JSON object, with keys and values that are not validated."""
+
+    @classmethod
+    def validate(cls, value: dict) -> None:
+        """Validate the object value."""
+        if not isinstance(value, dict):
+            raise ValueError(f"Value is not an object: {value}")
+
+    def as_json(self) -> dict:
+        """Return the object as a JSON-serialisable response."""
+        return dict(self)
+
+
 class StringPattern(String):
     """String pattern is a string with a regex pattern.
 
     The pattern is used to validate the string.
     """
     pattern: re.Pattern
+    # Bound match method of the compiled pattern
+    _match: Callable[[str], re.Match | None]
+
+    def __init_subclass__(cls, **kwargs):
+        """__init_subclass__ is called when a subclass is created.
+
+        Patterns declared as strings are compiled once here, and the match
+        method is bound, so validation calls the compiled pattern directly.
+        """
+        super().__init_subclass__(**kwargs)
+        pattern = getattr(cls, "pattern", None)
+        if isinstance(pattern, str):
+            pattern = cls.pattern = re.compile(pattern)
+        if pattern is not None:
+            cls._match = pattern.match
 
     def __new__(cls, value):
         """Validation is not carried out at instantiation time."""
         return super().__new__(cls, value)
+
+    @classmethod
+    def _unchecked(cls, value: str) -> "StringPattern":
+        """Create an instance from a value that is already known to be valid.
+
+        Used for parts of a value that has been validated as a whole.
+        """
+        return str.__new__(cls, value)
+
+    @classmethod
+    def _invalid(cls, value: str) -> ValueError:
+        """Create the error raised when the value does not match the pattern."""
+        return ValueError(
+            f"Value does not match pattern {cls.pattern.pattern!r}: {value}"
+        )
     
     @classmethod
     def validate(cls, value: str) -> None:
@@ -95,10 +231,8 @@ class StringPattern(String):
         This method is defined as a class method, so it can be called
         within __new__ if necessary.
         """
-        if not cls.pattern.match(value):
-            raise ValueError(
-                f"Value does not match pattern {cls.pattern.pattern!r}: {value}"
-            )
+        if not cls._match(value):
+            raise cls._invalid(value)
         
 
 class Base64String(StringPattern):
@@ -113,24 +247,52 @@ class UserID(StringPattern):
     """User IDs are the username part of the email address, for simplicity."""
     pattern = re.compile(fr'^{UserIDPattern}$')
 
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the user ID without running the pattern."""
+        if not _is_user_id(value):
+            raise cls._invalid(value)
+
 
 class Domain(StringPattern):
     """Domain names are the domain part of the email address."""
     pattern = re.compile(fr'^{DomainPattern}$')
 
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the domain name without running the pattern."""
+        if not _is_domain(value):
+            raise cls._invalid(value)
+
 
 class EmailAddress(StringPattern):
     """A typical email address."""
     pattern = fr'^{UserIDPattern}@{DomainPattern}$'
 
     def __new__(cls, value):
-        cls.validate(value)  # Ensure valid email address first
+        # The parts found while validating are reused, so value is split once
+        _user_id, _domain = cls._split(value)
         string = super().__new__(cls, value)
-        _user_id, _domain = value.split('@')
-        string.user_id = UserID(_user_id)
-        string.domain = Domain(_domain)
+        string.user_id = UserID._unchecked(_user_id)
+        string.domain = Domain._unchecked(_domain)
         return string
 
+    @classmethod
+    def _split(cls, value: str) -> tuple[str, str]:
+        """Split the email address into its user ID and domain, raising a
+        ValueError if either is invalid.
+
+        Neither part may contain '@', so the address splits at its first.
+        """
+        user_id, at, domain = value.partition('@')
+        if not (at and _is_user_id(user_id) and _is_domain(domain)):
+            raise cls._invalid(value)
+        return user_id, domain
+
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the email address without running the pattern."""
+        cls._split(value)
 
 class UID(StringPattern):
     """Campus IDs are based on shortened, base64-encoded UUIDs.
@@ -141,7 +303,21 @@ class UID(StringPattern):
     - 8 chars are used for resource IDs, expected to be limited in number.
     - 16 chars are used for source IDs, event IDs and other voluminuous IDs.
     """
-    pattern: re.Pattern
+    pattern = fr"^(?:{Uid8Pattern}|{Uid16Pattern})$"
+
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the UID without running the pattern.
+
+        Deleting the allowed bytes from a valid UID leaves nothing, which
+        translate() checks in a single pass.
+        """
+        if not (
+            len(value) in (8, 16)
+            and value.isascii()
+            and not value.encode().translate(None, _UID_BYTES)
+        ):
+            raise cls._invalid(value)
 
 
 class CampusID(UID):
@@ -152,19 +328,59 @@ class CampusID(UID):
 
     Example: uid-client-12345678
     """
-    pattern = re.compile(fr"^{UidPrefix}-({CampusLabelPattern})-({Uid8Pattern})$")
+    pattern = re.compile(fr"^{UidPrefixPattern}-({CampusLabelPattern})-({Uid8Pattern})$")
+    # Subclasses restricted to a single namespace fix the whole prefix
+    _prefix: str | None = None
 
     def __new__(cls, value):
-        if not (match := cls.pattern.match(value)):
-            raise ValueError(
-                f"Value does not match pattern {cls.pattern.pattern!r}: {value}"
-            )
+        cls.validate(value)
         string = super().__new__(cls, value)
-        _label, _uid = match.groups()
-        string.label = CampusLabel(_label)
-        string.uid = UID(_uid)
+        string.label = CampusLabel._unchecked(value[4:-9])
+        string.uid = UID._unchecked(value[-8:])
         return string
 
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the Campus ID without running the pattern.
+
+        The label and uid sit at fixed offsets from either end, so they
+        can be checked by slicing.
+        """
+        # Every Campus ID ends in a uid8, checked by the shared _is_uid8()
+        prefix = cls._prefix
+        valid = _is_uid8(value[-8:]) and (
+            # A fixed prefix leaves only the length to check
+            len(value) == len(prefix) + 8 and value.startswith(prefix)
+            if prefix
+            else (
+                value.startswith("uid-")
+                and value[-9:-8] == "-"
+                and _is_campus_label(value[4:-9])
+            )
+        )
+        if not valid:
+            raise cls._invalid(value)
+
+    @classmethod
+    def validate_many(cls, values: Sequence[str]) -> None:
+        """Validate each value, raising a ValueError for the first invalid one.
+
+        The values are joined with newlines and matched in a single
+        finditer() pass; they are only validated one at a time if fewer
+        than all of them match.
+        """
+        if len(values) == 1:
+            cls.validate(values[0])
+            return
+        buf = "\n".join(values)
+        # A newline inside a value would let it pass as two lines
+        if buf.count("\n") == len(values) - 1:
+            count = sum(1 for _ in _multiline(cls.pattern).finditer(buf))
+            if count == len(values):
+                return
+        for value in values:
+            cls.validate(value)
+
 
 class ClientID(CampusID):
     """Client IDs are UIDs UidPrefixed with a namespace.
@@ -174,8 +390,9 @@ class ClientID(CampusID):
 
     Example: uid-client-12345678
     """
-    pattern = re.compile(fr"^{UidPrefix}-client-{Uid8Pattern}$")
+    pattern = re.compile(fr"^{UidPrefixPattern}-client-{Uid8Pattern}$")
     label: Literal["client"]
+    _prefix = "uid-client-"
 
 
 class CircleID(CampusID):
@@ -186,8 +403,9 @@ class CircleID(CampusID):
 
     Example: uid-circle-12345678
     """
-    pattern = re.compile(fr"^{UidPrefix}-circle-{Uid8Pattern}$")
+    pattern = re.compile(fr"^{UidPrefixPattern}-circle-{Uid8Pattern}$")
     label: Literal["circle"]
+    _prefix = "uid-circle-"
 
 
 class CampusLabel(StringPattern):
@@ -198,6 +416,12 @@ class CampusLabel(StringPattern):
     """
     pattern = fr"^{CampusLabelPattern}$"
 
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the label without running the pattern."""
+        if not _is_campus_label(value):
+            raise cls._invalid(value)
+
 
 class OTP(StringPattern):
     """One-time password (OTP) is a 6-digit number.
@@ -206,6 +430,12 @@ class OTP(StringPattern):
     """
     pattern = re.compile(fr"^{DecimalChar}{{6}}$")
 
+    @classmethod
+    def validate(cls, value: str) -> None:
+        """Validate the OTP without running the pattern."""
+        if not (len(value) == 6 and value.isascii() and value.isdigit()):
+            raise cls._invalid(value)
+
 
 class Date(StringPattern):
     """Date is a string in the format YYYY-MM-DD.
@@ -217,18 +447,20 @@ class Date(StringPattern):
     pattern = re.compile(fr"^{DatePattern}$")
 
     def __new__(cls, value):
+        cls.validate(value)
         string = super().__new__(cls, value)
         string.year = int(value[:4])
         string.month = int(value[5:7])
         string.day = int(value[8:10])
-        string.date = datetime.strptime(value, "%Y-%m-%d").date()
+        string.date = date(string.year, string.month, string.day)
+        return string
 
     def replace(self, **kwargs) -> "Date":
         """Return a new Date with the same values, but with specified
         parameters updated.
         """
-        new_date = datetime.strptime(self, "%Y-%m-%d").date().replace(**kwargs)
-        return Date(new_date.strftime("%Y-%m-%d"))
+        new_date = self.date.replace(**kwargs)
+        return Date(new_date.isoformat())
     
     def weekday(self) -> int:
         """Return the weekday of the date (0=Monday, 6=Sunday)."""
@@ -249,17 +481,19 @@ class Time(StringPattern):
     pattern = fr"^{TimePattern}$"
 
     def __new__(cls, value):
+        cls.validate(value)
         string = super().__new__(cls, value)
         string.hour = int(value[:2])
         string.minute = int(value[3:5])
         string.second = int(value[6:8])
-        string.time = datetime.strptime(value, "%H:%M:%S").time()
+        string.time = time(string.hour, string.minute, string.second)
+        return string
 
     def replace(self, **kwargs) -> "Time":
         """Return a new Time with the same values, but with specified
         parameters updated.
         """
-        new_time = datetime.strptime(self, "%H:%M:%S").time().replace(**kwargs)
+        new_time = self.time.replace(**kwargs)
         return Time(new_time.strftime("%H:%M:%S"))
     
     def isoformat(self) -> str:
@@ -277,10 +511,15 @@ class Datetime(StringPattern):
     pattern = fr"^{DatetimePattern}$"
 
     def __new__(cls, value):
+        cls.validate(value)
         string = super().__new__(cls, value)
-        string.datetime = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-        string.date = Date(string.datetime.strftime("%Y-%m-%d"))
-        string.time = Time(string.datetime.strftime("%H:%M:%S"))
+        # The pattern fixes the position of each field
+        string.datetime = datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        )
+        string.date = Date(value[0:10])
+        string.time = Time(value[11:19])
         return string
     
     def date(self) -> Date:
@@ -339,3 +578,11 @@ class Datetime(StringPattern):
     def isocalendar(self) -> tuple[int, int]:
         """Return the ISO calendar of the datetime (year, week number)."""
         return self.datetime.isocalendar()
+
+
+# Class patterns are compiled when each class is created. The line-anchored
+# patterns used by validate_many() are compiled here too, so that every
+# pattern exists at import time (before any worker processes are forked).
+for _cls in (CampusID, ClientID, CircleID):
+    _multiline(_cls.pattern)
+del _cls
@@ -2,7 +2,7 @@
 
 Campus API model types.
 """
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from openapi.schema.datatypes import format_keyvalues
 
@@ -12,6 +12,8 @@ from campus.schema.datatypes import (
     CampusLabel,
     Date,
     Datetime,
+    Integer,
+    JsonObject,
     String,
     Time,
     UserID,
@@ -20,12 +22,57 @@ from campus.schema.datatypes import (
 )
 
 
+def _field_property(field: str) -> property:
+    """Create a property that reads the field from the model dict.
+
+    Missing fields raise AttributeError, so __getattr__ reports them.
+    """
+    def fget(self: dict) -> Validatable:
+        try:
+            return self[field]
+        except KeyError:
+            raise AttributeError(field) from None
+    return property(fget)
+
+
+def _build_init(cls: type) -> Callable[..., None]:
+    """Generate a straight-line __init__ for the model class.
+
+    The fields are written into the source, so each instance is checked
+    with a single keys comparison, and each field validated and cast
+    without looping over the class's fields.
+    """
+    lines = [
+        "def __init__(self, **kwargs):",
+        "    \"\"\"Check, validate and cast the given fields.\"\"\"",
+        "    if kwargs.keys() != _input_fields:",
+        "        self._raise_field_error(kwargs)",
+    ]
+    namespace = {"_input_fields": cls._required_input, "_dict_init": dict.__init__}
+    items = []
+    for i, (field, typecls) in enumerate(cls._init_plan):
+        namespace[f"_T{i}"] = typecls
+        lines.append(f"    v{i} = kwargs[{field!r}]")
+        lines.append(f"    _T{i}.validate(v{i})")
+        items.append(f"{field!r}: _T{i}(v{i})")
+    lines.append(f"    _dict_init(self, {{{', '.join(items)}}})")
+    exec("\n".join(lines), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
 class CampusModel(dict[str, Validatable]):
     """Base class for all models.
 
     This class is used to represent a model in the campus system.
     Models subclass Python dict for easier compatibility with JSON.
+    Fields are stored as dict items, so models (and their subclasses)
+    declare empty __slots__ to avoid also carrying an instance __dict__.
     """
+    __slots__ = ()
+    # Field groups are declared as tuples, and become frozensets once the
+    # subclass is created.
     # Hidden properties are not specified in requests, and not returned in responses
     __hidden__: tuple[str] = ()
     # Request-only properties are specified in requests, but not returned in responses
@@ -45,71 +92,104 @@ class CampusModel(dict[str, Validatable]):
         This init hook is used to validate properties and provide a validators
         class variable.
         """
+        # Field names are declared as tuples, and converted to frozensets
+        # here for hashed membership tests
+        cls.__hidden__ = frozenset(cls.__hidden__)
+        cls.__request_only__ = frozenset(cls.__request_only__)
+        cls.__response_only__ = frozenset(cls.__response_only__)
+        cls.__required__ = frozenset(cls.__required__)
+        for first, second, fields in (
+            ("hidden", "request-only", cls.__hidden__ & cls.__request_only__),
+            ("hidden", "response-only", cls.__hidden__ & cls.__response_only__),
+            ("required", "response-only", cls.__required__ & cls.__response_only__),
+            ("required", "hidden", cls.__required__ & cls.__hidden__),
+        ):
+            if fields:
+                raise TypeError(
+                    f"Field {min(fields)} cannot be both {first} and {second}"
+                )
         cls.validators = {}
         for field, typecls in cls.__annotations__.items():
             if field == "validators" or field.startswith("__"):
                 continue
-            if not isinstance(typecls, Validatable):
+            if not getattr(typecls, "__validatable__", False):
                 raise TypeError(f"Field {field} must be of type Validatable")
-            if field in cls.__hidden__ and field in cls.__request_only__:
-                raise TypeError(
-                    f"Field {field} cannot be both hidden and request-only"
-                )
-            if field in cls.__hidden__ and field in cls.__response_only__:
-                raise TypeError(
-                    f"Field {field} cannot be both hidden and response-only"
-                )
-            if field in cls.__required__ and field in cls.__response_only__:
-                raise TypeError(
-                    f"Field {field} cannot be both required and response-only"
-                )
-            if field in cls.__required__ and field in cls.__hidden__:
-                raise TypeError(
-                    f"Field {field} cannot be both required and hidden"
-                )
             cls.validators[field] = typecls
+            if not hasattr(dict, field):
+                setattr(cls, field, _field_property(field))
+        cls._allowed = frozenset(cls.validators)
+        cls._required_input = cls._allowed - cls.__hidden__ - cls.__response_only__
+        # Fields returned by as_json(), in declaration order
+        cls._json_fields = tuple(
+            field for field in cls.validators
+            if field not in cls.__hidden__ and field not in cls.__request_only__
+        )
+        cls._response_fields = frozenset(cls._json_fields)
+        # Fields passed to __init__, with their types, in declaration order
+        cls._init_plan = tuple(
+            (field, typecls)
+            for field, typecls in cls.validators.items()
+            if field in cls._required_input
+        )
+        # repr() template for instances holding exactly the __init__ fields
+        cls._repr_template = "{}({})".format(
+            cls.__name__,
+            ", ".join(f"{field}={{{field}!r}}" for field, _ in cls._init_plan),
+        )
+        # Instances are checked and built by an __init__ generated for the
+        # class's fields; see _build_init()
+        cls.__init__ = _build_init(cls)
 
-    def __init__(self, **kwargs):
-        """__init__ is called when an instance is created.
-
-        The init method checks for missing and invalid fields, and validates
-        the given keyword arguments.
+    @classmethod
+    def _raise_field_error(cls, kwargs: Mapping[str, Any]) -> None:
+        """Raise a KeyError describing why the given fields do not match
+        the fields accepted by __init__.
         """
-        invalid_fields = set(kwargs) - set(self.validators)
-        missing_fields = (
-            set(self.validators)
-            - set(kwargs)
-            - set(self.__hidden__)
-            - set(self.__response_only__)
-        )
-        if invalid_fields:
-            raise KeyError(f"Invalid fields: {invalid_fields}")
+        if not kwargs.keys() <= cls._allowed:
+            raise KeyError(f"Invalid fields: {kwargs.keys() - cls._allowed}")
+        missing_fields = cls._required_input - kwargs.keys()
         if missing_fields:
-            raise KeyError(f"Missing fields: {missing_fields}")
-        for field, Typecls in self.validators:
-            if field in self.__hidden__:
-                raise KeyError(
-                    f"Field {field} is hidden and should not be passed in init"
-                )
-            if field in self.__response_only__:
-                raise KeyError(
-                    f"Field {field} is response-only and should not be passed in init"
-                )
-            assert isinstance(Typecls, Validatable)  # appease linter
-            Typecls.validate(kwargs[field])
-        # Cast all values to their respective Validatable types
-        super().__init__(**{
-            field: Typecls(kwargs[field])
-            for field, Typecls in self.validators.items()
-        })
+            raise KeyError(f"Missing fields: {set(missing_fields)}")
+        if not kwargs.keys().isdisjoint(cls.__hidden__):
+            field = min(kwargs.keys() & cls.__hidden__)
+            raise KeyError(
+                f"Field {field} is hidden and should not be passed in init"
+            )
+        field = min(kwargs.keys() & cls.__response_only__)
+        raise KeyError(
+            f"Field {field} is response-only and should not be passed in init"
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CampusModel":
+        """Create a model from a response, such as the JSON from an API call.
+
+        Unlike __init__, response-only fields are accepted, and the fields
+        are read from the mapping instead of being passed as keyword
+        arguments.
+        """
+        if not data.keys() <= cls._response_fields:
+            raise KeyError(f"Invalid fields: {data.keys() - cls._response_fields}")
+        validators = cls.validators
+        built = {}
+        for field, value in data.items():
+            Typecls = validators[field]
+            Typecls.validate(value)
+            built[field] = Typecls(value)
+        model = cls.__new__(cls)
+        dict.__init__(model, built)
+        return model
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({format_keyvalues(self)})"
+        if self.keys() == self._required_input:
+            return self._repr_template.format_map(self)
+        return f"{self.__class__.__name__}{format_keyvalues(self)}"
     
     def __getattr__(self, field: str) -> Validatable:
         """Get an attribute from the model.
 
-        This method is used to get an attribute from the model.
+        Declared fields are read through properties; this is only reached
+        for other names, and for declared fields that are not set.
         """
         if field in self:
             return self[field]
@@ -118,9 +198,9 @@ class CampusModel(dict[str, Validatable]):
     def as_json(self) -> dict[str, Any]:
         """Return the model as a JSON-serialisable response."""
         return {
-            field: value.as_json()
-            for field, value in self.items()
-            if not (field in self.__hidden__ or field in self.__request_only__)
+            field: self[field].as_json()
+            for field in self._json_fields
+            if field in self
         }
     
     @classmethod
@@ -129,28 +209,30 @@ class CampusModel(dict[str, Validatable]):
 
         This method is used to validate a request to the model.
         """
-        required_fields = list(cls.__required__)
+        fields = request.keys()
+        if not fields <= cls._allowed:
+            raise KeyError(f"Invalid field: {min(fields - cls._allowed)}")
+        if not fields.isdisjoint(cls.__hidden__):
+            raise KeyError(f"Field {min(fields & cls.__hidden__)} is hidden")
+        if not fields.isdisjoint(cls.__response_only__):
+            raise KeyError(
+                f"Field {min(fields & cls.__response_only__)} is response-only"
+            )
+        missing_fields = cls.__required__ - fields
+        if missing_fields:
+            raise KeyError(f"Required fields are missing: {sorted(missing_fields)}")
         for field, value in request.items():
-            if field not in cls.validators:
-                raise KeyError(f"Invalid field: {field}")
-            if field in cls.__hidden__:
-                raise KeyError(f"Field {field} is hidden")
-            if field in cls.__response_only__:
-                raise KeyError(f"Field {field} is response-only")
-            required_fields.remove(field)
             cls.validators[field].validate(value)
-        if required_fields:
-            raise KeyError(f"Required fields are missing: {required_fields}")
-
 
 class User(CampusModel):
     """Campus user model.
 
     This model is used to represent a user in the campus system.
     """
+    __slots__ = ()
     __response_only__ = ("id", "activated_at")
     id: UserID
-    name: str
+    name: String
     email: EmailAddress
     activated_at: Datetime
 
@@ -160,6 +242,7 @@ class Client(CampusModel):
 
     This model is used to represent a client in the campus system.
     """
+    __slots__ = ()
     __hidden__ = ("secret_hash",)
     __response_only__ = ("id", "created_at")
     id: CampusID
@@ -174,28 +257,31 @@ class Circle(CampusModel):
 
     This model is used to represent a circle in the campus system.
     """
+    __slots__ = ()
     __response_only__ = ("id", "created_at", "members", "sources")
-    __required__ = ("id", "name", "tag", "created_at")
+    __required__ = ("name", "tag")
     id: CampusID
     name: CampusLabel
     description: String
     tag: String
-    members: dict[CampusID, int]
+    members: JsonObject  # CampusID to AccessValue
     created_at: Datetime
-    sources: dict  # SourceID, SourceHeader
+    sources: JsonObject  # SourceID to SourceHeader
 
 
 class CircleNew(CampusModel):
     """Request schema for creating a new circle."""
+    __slots__ = ()
     __required__ = ("name", "tag")
     name: CampusLabel
     description: String
     tag: String
-    parents: dict[String, int]  # CirclePath to AccessValue
+    parents: JsonObject  # CirclePath to AccessValue
 
 
 class CircleUpdate(CampusModel):
     """Request schema for updating a circle."""
+    __slots__ = ()
     __required__ = ()
     name: CampusLabel
     description: String
@@ -203,19 +289,22 @@ class CircleUpdate(CampusModel):
 
 class CircleMemberAdd(CampusModel):
     """Request schema for adding a member to a circle."""
+    __slots__ = ()
     __required__ = ("member_id", "access_value")
     member_id: CampusID
-    access_value: int
+    access_value: Integer
 
 
 class CircleMemberRemove(CampusModel):
     """Request schema for removing a member from a circle."""
+    __slots__ = ()
     __required__ = ("member_id",)
     member_id: CampusID
 
 
 class CircleMemberSet(CampusModel):
     """Request schema for setting a member's access in a circle."""
+    __slots__ = ()
     __required__ = ("member_id", "access_value")
     member_id: CampusID
-    access_value: int
+    access_value: Integer
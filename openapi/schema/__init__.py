@@ -27,6 +27,16 @@ from .datatypes import (
     AllOf,
     AnyOf,
     OneOf,
+    STRING,
+    NUMBER,
+    INTEGER,
+    BOOLEAN,
+    BYTE,
+    DATE,
+    DATETIME,
+    EMAIL,
+    TIME,
+    dumps,
 )
 from .info import (
     ContactInfo,
@@ -69,6 +79,16 @@ __all__ = [
     "AllOf",
     "AnyOf",
     "OneOf",
+    "STRING",
+    "NUMBER",
+    "INTEGER",
+    "BOOLEAN",
+    "BYTE",
+    "DATE",
+    "DATETIME",
+    "EMAIL",
+    "TIME",
+    "dumps",
     "ContactInfo",
     "LicenseInfo",
     "ExternalDocs",
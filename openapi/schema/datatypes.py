@@ -3,8 +3,15 @@
 Data types as defined in the OpenAPI 3.0 Specification.
 https://swagger.io/docs/specification/v3_0/data-models/data-types/
 """
-from abc import ABC, abstractmethod
-from typing import Any, Final, Literal, Mapping
+from collections import deque
+from typing import Any, Callable, ClassVar, Final, Literal, Mapping
+from weakref import WeakValueDictionary
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    import json
 
 Mimetype = str
 Content = Mapping[Mimetype, "Schema"]
@@ -34,7 +41,7 @@ def format_sequence(
     Returns:
         A string representation of the sequence.
     """
-    return f"{start}{separator.join(map(repr, sequence))}{end}"
+    return start + separator.join(map(repr, sequence)) + end
 
 
 def format_keyvalues(
@@ -52,130 +59,355 @@ def format_keyvalues(
     Returns:
         A string representation of the key-value pairs.
     """
-    return (
-        f"""{start}{separator.join(
-            f'{key}{delimiter}{value!r}'
-            for key, value in keyvalues.items()
-        )}{end}"""
+    return start + separator.join(
+        key + delimiter + repr(value) for key, value in keyvalues.items()
+    ) + end
+
+
+def format_fields(obj: Any, fields: tuple[str, ...]) -> str:
+    """Format an object's fields as a string, skipping those that are None.
+
+    Args:
+        obj: The object to format.
+        fields: The names of the fields to include.
+
+    Returns:
+        The object's class name followed by its fields as key-value pairs.
+    """
+    return obj.__class__.__name__ + format_keyvalues({
+        field: value
+        for field in fields
+        if (value := getattr(obj, field)) is not None
+    })
+
+
+# Position of a child schema in its parent's json, as (container, key or
+# index, extra), where extra holds keys to add to the child's json or None
+Slot = tuple[dict | list, Any, dict | None]
+Shell = tuple[dict, list[Slot]]
+
+# Statements for each kind of json field, formatted with the field name.
+# Child schemas are left in place and their slots recorded in children, to
+# be filled in by serialize().
+_JSON_STMTS: Final = {
+    "value": ("json_[{0!r}] = value",),
+    "copy": ("json_[{0!r}] = value.copy()",),
+    "schema": (
+        "json_[{0!r}] = value",
+        "children.append((json_, {0!r}, None))",
+    ),
+    "schemas": (
+        "json_[{0!r}] = items = list(value)",
+        "children.extend((items, i, None) for i in range(len(items)))",
+    ),
+}
+
+
+def _build_shell_method(cls: type) -> Callable[["Schema"], Shell]:
+    """Generate a straight-line _build_shell for the schema class.
+
+    The class's type and format are written into the source as literals,
+    and only the fields the class declares in _json_fields are checked.
+    """
+    lines = ["def _build_shell(self):"]
+    constants = {
+        key: getattr(cls, key, None) for key in ("type", "format")
+    }
+    literal = ", ".join(
+        f"{key!r}: {value!r}"
+        for key, value in constants.items()
+        if value is not None
     )
+    lines.append(f"    json_ = {{{literal}}}")
+    lines.append("    children = []")
+    for field, kind in cls._json_fields:
+        lines.append(f"    value = self.{field}")
+        lines.append("    if value is not None:")
+        lines.extend(f"        {stmt.format(field)}" for stmt in _JSON_STMTS[kind])
+    lines.append("    return json_, children")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<to_json:{cls.__name__}>", "exec"), namespace)
+    build_shell = namespace["_build_shell"]
+    build_shell.__qualname__ = f"{cls.__qualname__}._build_shell"
+    return build_shell
+
+
+def _build_repr_method(cls: type) -> Callable[["Schema"], str]:
+    """Generate a __repr__ for the schema class from its _repr_fields.
+
+    Only the declared fields are shown, skipping those that are None, so
+    repr() does not serialize the schema.
+    """
+    lines = ["def __repr__(self):", "    parts = []"]
+    for field in cls._repr_fields:
+        lines.append(f"    value = self.{field}")
+        lines.append("    if value is not None:")
+        lines.append(f"        parts.append({field + '='!r} + repr(value))")
+    lines.append(f"    return {cls.__name__ + '('!r} + ', '.join(parts) + ')'")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<repr:{cls.__name__}>", "exec"), namespace)
+    repr_ = namespace["__repr__"]
+    repr_.__qualname__ = f"{cls.__qualname__}.__repr__"
+    return repr_
+
+
+def serialize(root: "Schema") -> dict:
+    """Convert a schema tree to a json dictionary.
+
+    The tree is walked with an explicit stack instead of recursion, so deeply
+    nested schemas neither hit the recursion limit nor pay for a Python call
+    per node.
+
+    Extra keys for a child are added to a copy of its json once the whole
+    tree is built, so the child's own cached json is left unchanged.
+
+    Each node's json is cached on the node as a one-item tuple, published
+    with a single attribute store only after the whole tree is complete.
+    Other threads serializing the same schemas therefore never see a
+    partly built json; at worst they build an equal one themselves.
+    """
+    try:
+        return root._json_cache[0]
+    except AttributeError:
+        pass
+    top = [root]
+    stack = deque([(top, 0, None)])
+    extras = []
+    # Nodes built in this call, by id, so shared nodes are built once
+    built: dict[int, tuple[Schema, dict]] = {}
+    while stack:
+        container, key, extra = stack.pop()
+        if extra:
+            extras.append((container, key, extra))
+        node = container[key]
+        try:
+            container[key] = node._json_cache[0]
+            continue
+        except AttributeError:
+            pass
+        entry = built.get(id(node))
+        if entry is not None:
+            container[key] = entry[1]
+            continue
+        json_, children = node._build_shell()
+        built[id(node)] = (node, json_)
+        container[key] = json_
+        stack.extend(children)
+    for container, key, extra in extras:
+        container[key] = {**container[key], **extra}
+    for node, json_ in built.values():
+        node._json_cache = (json_,)
+    return top[0]
+
+
+# Shared instances of leaf schemas, keyed by class and constructor arguments
+_interned: WeakValueDictionary[tuple, "Schema"] = WeakValueDictionary()
+
+
+def _intern(cls: type, args: tuple, kwargs: dict) -> "Schema":
+    """Return the shared instance of cls for the given arguments, creating
+    it if needed.
+
+    Leaf schemas are not mutated after construction, so equal schemas can
+    be the same object and share one json cache. Arguments that cannot be
+    hashed (such as enum lists) get a new instance instead.
+    """
+    try:
+        key = (cls, args, frozenset(kwargs.items()))
+        return _interned[key]
+    except TypeError:
+        return object.__new__(cls)
+    except KeyError:
+        schema = _interned[key] = object.__new__(cls)
+        return schema
+
+
+def dumps(schema: "Schema") -> bytes:
+    """Serialize a schema to json bytes.
+
+    Uses orjson if it is installed, which is several times faster than the
+    standard library on large documents. to_json() only produces plain
+    dicts, lists, strings, numbers, booleans and None, so no default
+    handler is needed.
+    """
+    if orjson is not None:
+        return orjson.dumps(schema.to_json())
+    return json.dumps(schema.to_json()).encode()
 
 
-class Schema(ABC):
+class Schema:
     """Base class for all schemas.
 
     All schemas must inherit from this class.
+
+    Schemas are not mutated after construction, so the json dictionary is
+    built once and cached on the instance. The returned dictionary is
+    shared by all callers and must not be mutated; copy it first if needed.
+
+    Subclasses build their json in _build_shell, which returns the json
+    with child schemas left in place and the slots where they were put.
+    They may declare _json_fields, pairs of attribute name and kind
+    (see _JSON_STMTS), instead of writing _build_shell by hand.
+
+    __repr__ is generated from _repr_fields unless a subclass defines it.
     """
+    __slots__ = ("_json_cache",)
+    _json_fields: tuple[tuple[str, str], ...] | None = None
+    _repr_fields: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses regenerate _build_shell so their type and format are
+        # baked in; see _build_shell_method()
+        if cls._json_fields is not None and "_build_shell" not in cls.__dict__:
+            cls._build_shell = _build_shell_method(cls)
+        if "__repr__" not in cls.__dict__:
+            cls.__repr__ = _build_repr_method(cls)
+        # Schema is not an ABC, which would slow every instantiation; the
+        # check is made once per subclass instead, and skipped under -O
+        if __debug__ and cls._build_shell is Schema._build_shell:
+            raise TypeError(f"{cls.__name__} must define _build_shell")
 
-    @abstractmethod
     def to_json(self) -> dict:
         """Convert the schema to a json dictionary."""
-        pass
+        return serialize(self)
+
+    def _build_shell(self) -> Shell:
+        """Build the json for the schema, without its child schemas."""
+        raise NotImplementedError
 
 
 
 # Basic types
 
 class BasicSchema(Schema):
-    """Base class for basic schemas."""
-    # type should be declared as a class variable
-    nullable: bool | None = None
+    """Base class for basic schemas, with (optional) format.
+
+    Instances are shared between equal schemas; see _intern().
+    """
+    __slots__ = ("nullable", "__weakref__")
+    # type and format are declared as class variables; the generated
+    # _build_shell only emits format when it is not None
+    nullable: bool | None
     type: BasicType
+    format: ClassVar[str | None] = None
+    _json_fields = (("nullable", "value"),)
+    _repr_fields = ("nullable",)
 
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_keyvalues(self.to_json())}"
+    def __new__(cls, *args, **kwargs):
+        return _intern(cls, args, kwargs)
+
+    def __init__(self, *, nullable: bool | None = None):
+        self.nullable = nullable
 
-    def to_json(self) -> dict:
-        return {"type": self.type}
-    
 
 class Reference(Schema):
     """Represents a reference as defined in OpenAPI 3.0.
 
     https://swagger.io/docs/specification/v3_0/using-ref/
     """
+    __slots__ = ("ref",)
     ref: RefPattern
+    _repr_fields = ("ref",)
 
     def __init__(self, ref: RefPattern):
         # TODO: Validate RefPattern
         self.ref = ref
+        # The json depends only on ref, so it is built here rather than
+        # on first serialization
+        self._json_cache = ({"$ref": ref},)
 
-    def to_json(self) -> dict:
-        return {"$ref": self.ref}
+    def _build_shell(self) -> Shell:
+        return {"$ref": self.ref}, []
 
 
 class PathReference(Reference):
     """A reference to a Path entry in Component."""
+    __slots__ = ()
 
 
 class SchemaReference(Reference):
     """A reference to a Schema entry in Component."""
+    __slots__ = ()
 
 
-class FormatSchema(Schema):
-    """Base class for schemas with (optional) format."""
-    type: BasicType
-    format: str
-
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_keyvalues(self.to_json())}"
-
-    def to_json(self) -> dict:
-        json_ = {"type": self.type}
-        if self.format is not None:
-            json_["format"] = self.format
-        return json_
-
-
-class String(FormatSchema):
+class String(BasicSchema):
+    __slots__ = ("pattern", "enum")
     type: BasicType = "string"
-    pattern: str | None = None
-    enum: list[Schema | SchemaReference] | None = None
-
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_keyvalues(self.to_json())}"
+    pattern: str | None
+    enum: list[Schema | SchemaReference] | None
+    _json_fields = (
+        ("enum", "schemas"),
+        ("pattern", "value"),
+        ("nullable", "value"),
+    )
+    _repr_fields = ("pattern", "enum", "nullable")
 
-    def to_json(self) -> dict:
-        result = super().to_json()
-        if self.enum is not None:
-            result["enum"] = [enum.to_json() for enum in self.enum]
-        if self.pattern is not None:
-            result["pattern"] = self.pattern
-        return result
+    def __init__(
+            self,
+            pattern: str | None = None,
+            enum: list[Schema | SchemaReference] | None = None,
+            *,
+            nullable: bool | None = None,
+    ):
+        super().__init__(nullable=nullable)
+        self.pattern = pattern
+        self.enum = enum
 
 
-class Number(FormatSchema):
+class Number(BasicSchema):
+    __slots__ = ("enum",)
     type: BasicType = "number"
-    enum: list[float | int] | None = None
+    enum: list[float | int] | None
+    _json_fields = (("enum", "copy"), ("nullable", "value"))
+    _repr_fields = ("enum", "nullable")
 
-    def to_json(self) -> dict:
-        result = super().to_json()
-        if self.enum is not None:
-            result["enum"] = self.enum.copy()
-        return result
+    def __init__(
+            self,
+            enum: list[float | int] | None = None,
+            *,
+            nullable: bool | None = None,
+    ):
+        super().__init__(nullable=nullable)
+        self.enum = enum
 
 
 class Integer(BasicSchema):
+    __slots__ = ("enum",)
     type: BasicType = "integer"
-    format: str | None = None
-    enum: list[int] | None = None
+    enum: list[int] | None
+    _json_fields = (("enum", "copy"), ("nullable", "value"))
+    _repr_fields = ("enum", "nullable")
 
-    def to_json(self) -> dict:
-        result = super().to_json()
-        if self.enum is not None:
-            result["enum"] = self.enum.copy()
-        return result
+    def __init__(
+            self,
+            enum: list[int] | None = None,
+            *,
+            nullable: bool | None = None,
+    ):
+        super().__init__(nullable=nullable)
+        self.enum = enum
 
 
 class Boolean(BasicSchema):
+    __slots__ = ()
     type: BasicType = "boolean"
 
 
 class Array(Schema):
+    __slots__ = ("items", "minItems", "maxItems", "uniqueItems")
     type: BasicType = "array"
     items: Schema | SchemaReference
-    minItems: int | None = None
-    maxItems: int | None = None
+    minItems: int | None
+    maxItems: int | None
     uniqueItems: bool | None
+    _json_fields = (
+        ("items", "schema"),
+        ("minItems", "value"),
+        ("maxItems", "value"),
+        ("uniqueItems", "value"),
+    )
+    _repr_fields = ("items", "minItems", "maxItems", "uniqueItems")
 
     def __init__(
             self,
@@ -189,21 +421,17 @@ class Array(Schema):
         self.maxItems = maxItems
         self.uniqueItems = uniqueItems
     
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_keyvalues(self.to_json())}"
-    
-    def to_json(self) -> dict:
-        json_ = {"type": self.type, "items": self.items.to_json()}
-        if self.minItems is not None:
-            json_["minItems"] = self.minItems
-        if self.maxItems is not None:
-            json_["maxItems"] = self.maxItems
-        if self.uniqueItems is not None:
-            json_["uniqueItems"] = self.uniqueItems
-        return json_
-
 
 class Object(Schema):
+    __slots__ = (
+        "properties",
+        "readOnly",
+        "writeOnly",
+        "required",
+        "additionalProperties",
+        "minProperties",
+        "maxProperties",
+    )
     type: BasicType = "object"
     properties: dict[str, Schema | SchemaReference]
     # The readOnly and writeOnly properties are defined per property
@@ -211,10 +439,19 @@ class Object(Schema):
     readOnly: dict[str, bool]
     writeOnly: dict[str, bool]
     # Required is an object-level attribute, not a property attribute
-    required: list[str] | None = None
-    additionalProperties: bool | Schema | SchemaReference | None = None
-    minProperties: int | None = None
-    maxProperties: int | None = None
+    required: list[str] | None
+    additionalProperties: bool | Schema | SchemaReference | None
+    minProperties: int | None
+    maxProperties: int | None
+    _repr_fields = (
+        "properties",
+        "required",
+        "readOnly",
+        "writeOnly",
+        "additionalProperties",
+        "minProperties",
+        "maxProperties",
+    )
 
     def __init__(
             self,
@@ -250,39 +487,39 @@ class Object(Schema):
         self.minProperties = minProperties
         self.maxProperties = maxProperties
 
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_keyvalues(self.to_json())}"
-    
-    def to_json(self) -> dict:
+    def _build_shell(self) -> Shell:
+        readOnly = self.readOnly
+        writeOnly = self.writeOnly
+        properties = {}
+        children = []
+        # Properties and their slots are built in one pass; readOnly and
+        # writeOnly are set on the property's json
+        for prop, schema in self.properties.items():
+            properties[prop] = schema
+            if prop in readOnly or prop in writeOnly:
+                extra = {}
+                if prop in readOnly:
+                    extra["readOnly"] = True
+                if prop in writeOnly:
+                    extra["writeOnly"] = True
+                children.append((properties, prop, extra))
+            else:
+                children.append((properties, prop, None))
         json_ = {
             "type": self.type,
-            "properties": {
-                key: value.to_json()
-                for key, value in self.properties.items()
-            }
+            "properties": properties,
         }
-        for prop, schema in json_.items():
-            if self.readOnly.get(prop):
-                schema["readOnly"] = True
-            if self.writeOnly.get(prop):
-                schema["writeOnly"] = True
         if self.required is not None:
             json_["required"] = self.required
-        if self.readOnly is not None:
-            json_["readOnly"] = self.readOnly
-        if self.writeOnly is not None:
-            json_["writeOnly"] = self.writeOnly
         if self.additionalProperties is not None:
-            json_["additionalProperties"] = (
-                self.additionalProperties.to_json()
-                if isinstance(self.additionalProperties, Schema)
-                else self.additionalProperties
-            )
+            json_["additionalProperties"] = self.additionalProperties
+            if isinstance(self.additionalProperties, Schema):
+                children.append((json_, "additionalProperties", None))
         if self.minProperties is not None:
             json_["minProperties"] = self.minProperties
         if self.maxProperties is not None:
             json_["maxProperties"] = self.maxProperties
-        return json_
+        return json_, children
 
 
 # String formats
@@ -292,8 +529,9 @@ class Byte(String):
 
     Example: "SGVsbG8gV29ybGQh"
     """
+    __slots__ = ()
     type: BasicType = "string"
-    format: str = "byte"
+    format: ClassVar[str] = "byte"
 
 
 class Date(String):
@@ -301,8 +539,9 @@ class Date(String):
 
     Example: "2023-10-01"
     """
+    __slots__ = ()
     type: BasicType = "string"
-    format: str = "date"
+    format: ClassVar[str] = "date"
 
 
 class DateTime(String):
@@ -310,8 +549,9 @@ class DateTime(String):
 
     Example: "2023-10-01T12:00:00Z
     """
+    __slots__ = ()
     type: BasicType = "string"
-    format: str = "date-time"
+    format: ClassVar[str] = "date-time"
 
 
 class Email(String):
@@ -319,8 +559,9 @@ class Email(String):
 
     Example: user.name_2024@nyjc.edu.sg
     """
+    __slots__ = ()
     type: BasicType = "string"
-    format: str = "email"
+    format: ClassVar[str] = "email"
 
 
 class Time(String):
@@ -328,28 +569,58 @@ class Time(String):
 
     Example: "12:00:00Z"
     """
+    __slots__ = ()
     type: BasicType = "string"
-    format: str = "time"
+    format: ClassVar[str] = "time"
+
+
+
+# Shared instances of the common leaf schemas; prefer these to
+# constructing new ones
+
+STRING: Final = String()
+NUMBER: Final = Number()
+INTEGER: Final = Integer()
+BOOLEAN: Final = Boolean()
+BYTE: Final = Byte()
+DATE: Final = Date()
+DATETIME: Final = DateTime()
+EMAIL: Final = Email()
+TIME: Final = Time()
 
 
 
 # Mixed types
 
+# Combinators with more children than this show them by type in repr(),
+# rather than recursing into each one
+_REPR_MAX_ITEMS: Final = 8
+
+
+def _repr_items(schema: "AllOf | AnyOf | OneOf") -> str:
+    """Format a combinator schema and its children as a string."""
+    if len(schema.items) > _REPR_MAX_ITEMS:
+        names = ", ".join(type(item).__name__ for item in schema.items)
+        return f"{schema.__class__.__name__}({names})"
+    return schema.__class__.__name__ + format_sequence(schema.items)
+
+
 class AllOf(Schema):
     """All of the given schemas.
 
     This is used to represent a schema that must be all of several types.
     """
-    items: list[Schema]
+    __slots__ = ("items",)
+    items: tuple[Schema, ...]
 
     def __init__(self, *schemas: Schema):
-        self.items = list(schemas)
+        self.items = schemas
 
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_sequence(self.items)}"
+    __repr__ = _repr_items
 
-    def to_json(self) -> dict:
-        return {"allOf": [schema.to_json() for schema in self.items]}
+    def _build_shell(self) -> Shell:
+        items = list(self.items)
+        return {"allOf": items}, [(items, i, None) for i in range(len(items))]
 
 
 class AnyOf(Schema):
@@ -357,16 +628,17 @@ class AnyOf(Schema):
 
     This is used to represent a schema that can be any of several types.
     """
-    items: list[Schema]
+    __slots__ = ("items",)
+    items: tuple[Schema, ...]
 
     def __init__(self, *schemas: Schema):
-        self.items = list(schemas)
+        self.items = schemas
     
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_sequence(self.items)}"
+    __repr__ = _repr_items
 
-    def to_json(self) -> dict:
-        return {"anyOf": [schema.to_json() for schema in self.items]}
+    def _build_shell(self) -> Shell:
+        items = list(self.items)
+        return {"anyOf": items}, [(items, i, None) for i in range(len(items))]
 
 
 class OneOf(Schema):
@@ -374,16 +646,17 @@ class OneOf(Schema):
 
     This is used to represent a schema that can be one of several types.
     """
-    items: list[Schema]
+    __slots__ = ("items",)
+    items: tuple[Schema, ...]
 
     def __init__(self, *schemas: Schema):
-        self.items = list(schemas)
+        self.items = schemas
 
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_sequence(self.items)}"
+    __repr__ = _repr_items
 
-    def to_json(self) -> dict:
-        return {"oneOf": [schema.to_json() for schema in self.items]}
+    def _build_shell(self) -> Shell:
+        items = list(self.items)
+        return {"oneOf": items}, [(items, i, None) for i in range(len(items))]
 
 
 
@@ -394,9 +667,12 @@ class AnyValue(Schema):
 
     This is used to represent a schema that can be any value.
     """
-    description: str | None = None
-    nullable: bool | None = None
-    
+    __slots__ = ("description", "nullable")
+    description: str | None
+    nullable: bool | None
+    _json_fields = (("description", "value"), ("nullable", "value"))
+    _repr_fields = ("description", "nullable")
+
     def __init__(
             self,
             description: str | None = None,
@@ -405,13 +681,3 @@ class AnyValue(Schema):
         self.description = description
         self.nullable = nullable
     
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{format_keyvalues(self.to_json())}"
-
-    def to_json(self) -> dict:
-        json_ = {}
-        if self.description is not None:
-            json_["description"] = self.description
-        if self.nullable is not None:
-            json_["nullable"] = self.nullable
-        return json_
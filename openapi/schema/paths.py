@@ -3,9 +3,10 @@
 Classes for representing API paths
 """
 
-from typing import Literal, Mapping, Sequence, get_args
+from dataclasses import dataclass
+from typing import ClassVar, Literal, Mapping, Sequence, get_args
 
-from .datatypes import Content, Schema
+from .datatypes import Content, Schema, format_fields
 from .info import ExternalDocs
 from .request import RequestBody
 from .response import Response
@@ -15,7 +16,13 @@ PathPattern = str
 HttpMethod = Literal["get", "post", "patch", "put", "delete", "head", "options", "trace", "connect"]
 ParameterLocation = Literal["cookie", "header", "path", "query"]
 
+_HTTP_METHODS: frozenset[str] = frozenset(get_args(HttpMethod))
+_PARAMETER_LOCATIONS: frozenset[str] = frozenset(get_args(ParameterLocation))
+# Operations mostly share a few tag sets, so equal tags tuples are shared
+_TAG_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
 
+
+@dataclass(slots=True)
 class Parameter:
     """Represents an operation as defined in OpenAPI 3.0.
 
@@ -27,107 +34,84 @@ class Parameter:
     in_: ParameterLocation
     name: str
     summary: str | None = None
-    description: str | None
-    schema: Schema | None
-    content: Content | None
-    required: bool | None
-
-    def __init__(
-            self,
-            in_: ParameterLocation,
-            name: str,
-            summary: str | None = None,
-            description: str | None = None,
-            schema: Schema | None = None,
-            content: Content | None = None,
-            required: bool | None = None,
-    ):
-        if schema and content:
+    description: str | None = None
+    schema: Schema | None = None
+    content: Content | None = None
+    required: bool | None = None
+
+    def __post_init__(self):
+        if self.in_ not in _PARAMETER_LOCATIONS:
+            raise ValueError(f"Invalid parameter location: {self.in_}")
+        if self.schema and self.content:
             raise ValueError("Specify schema or content, not both")
-        if in_ == "path" and not required:
+        if self.in_ == "path" and not self.required:
             raise ValueError("Path parameters must have `required: true`")
-        if schema.default is not None and required:
+        # Not all schemas declare a default
+        if getattr(self.schema, "default", None) is not None and self.required:
             raise ValueError("Schema default value will never be used as parameter value is required")
-        if content:
+        if self.content:
             raise NotImplementedError("This version of the OpenAPI 3.0 spec does not support `content` parameters yet.")
-        self.in_ = in_
-        self.name = name
-        self.summary = summary
-        self.description = description
-        self.schema = schema
-        self.content = content
-        self.required = required
 
 
+@dataclass(slots=True, kw_only=True)
 class Operation:
     """Represents an operation as defined in OpenAPI 3.0.
 
     https://swagger.io/docs/specification/v3.0/paths-and-operations/
     """
-    method: HttpMethod
-    deprecated: bool | None
-    requestBody: RequestBody | None
-    responses: Sequence[Response] | None 
-    operationId: str | None
-    tags: Sequence[str]
-    summary: str | None
-    description: str | None
-    parameters: Sequence[Parameter] | None
-    externalDocs: ExternalDocs | None
-    servers: Sequence[Server] | None
+    # method is declared as a class variable by each subclass
+    method: ClassVar[HttpMethod]
+    deprecated: bool | None = None
+    requestBody: RequestBody | None = None
+    responses: Sequence[Response] | None = None
+    operationId: str | None = None
+    tags: Sequence[str] = ()
+    summary: str | None = None
+    description: str | None = None
+    parameters: Sequence[Parameter] | None = None
+    externalDocs: ExternalDocs | None = None
+    servers: Sequence[Server] | None = None
+
+    def __post_init__(self):
+        tags = tuple(self.tags)
+        self.tags = _TAG_CACHE.setdefault(tags, tags)
+
 
-    def __init__(
-            self,
-            *,
-            deprecated: bool | None = None,
-            requestBody: RequestBody | None = None,
-            responses: Sequence[Response] | None = None, 
-            operationId: str | None = None,
-            tags: Sequence[str] = (),
-            summary: str | None = None,
-            description: str | None = None,
-            parameters: Sequence[Parameter] | None = None,
-            externalDocs: ExternalDocs | None = None,
-            servers: Sequence[Server] | None = None,
-    ):
-        self.deprecated = deprecated
-        self.requestBody = requestBody
-        self.responses = responses
-        self.operationId = operationId
-        self.tags = tuple(tags)
-        self.summary = summary
-        self.description = description
-        self.parameters = parameters
-        self.externalDocs = externalDocs
-        self.servers = servers
-        
-    
 class GetOperation(Operation):
-    method: HttpMethod = "get"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "get"
 
 class PostOperation(Operation):
-    method: HttpMethod = "post"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "post"
 
 class PutOperation(Operation):
-    method: HttpMethod = "put"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "put"
 
 class DeleteOperation(Operation):
-    method: HttpMethod = "delete"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "delete"
 
 class PatchOperation(Operation):
-    method: HttpMethod = "patch"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "patch"
 
 class HeadOperation(Operation):
-    method: HttpMethod = "head"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "head"
 
 class OptionsOperation(Operation):
-    method: HttpMethod = "options"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "options"
 
 class TraceOperation(Operation):
-    method: HttpMethod = "trace"
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "trace"
 
 class ConnectOperation(Operation):
-    method: HttpMethod = "connect" 
+    __slots__ = ()
+    method: ClassVar[HttpMethod] = "connect" 
 
 
 class Path:
@@ -135,9 +119,10 @@ class Path:
 
     https://swagger.io/docs/specification/v3.0/paths-and-operations/
     """
+    __slots__ = ("path", "summary", "description", "methods")
     path: PathPattern
-    summary: str | None = None
-    description: str | None = None
+    summary: str | None
+    description: str | None
     methods: Mapping[HttpMethod, Operation]
 
     def __init__(
@@ -150,10 +135,10 @@ class Path:
         self.path = path
         self.summary = summary
         self.description = description
-        invalid_methods = [
-            method for method in methods
-            if methods not in get_args(HttpMethod)
-        ]
+        invalid_methods = methods.keys() - _HTTP_METHODS
         if invalid_methods:
             raise KeyError(f"Invalid HTTP method: {invalid_methods}")
         self.methods = methods
+
+    def __repr__(self) -> str:
+        return format_fields(self, self.__slots__)
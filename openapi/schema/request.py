@@ -3,24 +3,20 @@
 Classes for representing Requests
 """
 
+from dataclasses import dataclass
+
 from .datatypes import Content
 
 
+@dataclass(slots=True)
 class RequestBody:
     """Represents a request body as defined in OpenAPI 3.0.
 
     https://swagger.io/docs/specification/v3.0/describing-request-body/
     """
-    description: str | None
-    required: bool | None
     content: Content
+    description: str | None = None
+    required: bool | None = None
 
-    def __init__(
-            self,
-            content: Content,
-            description: str | None = None,
-            required: bool | None = None,
-    ):
-        self.required = required
-        self.description = description
-        self.content = dict(content)
+    def __post_init__(self):
+        self.content = dict(self.content)
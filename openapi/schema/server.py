@@ -3,20 +3,28 @@
 Classes for representing API servers
 """
 
+from dataclasses import dataclass, field
 from typing import Mapping, Sequence
 
+from .datatypes import format_fields
 
+# Equal enum tuples are shared between server variables
+_ENUM_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+@dataclass(slots=True)
 class ServerVariable:
     """Represents a server variable as defined in OpenAPI 3.0.
 
     https://swagger.io/docs/specification/v3_0/api-host-and-base-path/
     """
     default: str
-    enum: tuple[str] = ()
+    description: str | None = None
+    enum: Sequence[str] = field(default=(), kw_only=True)
 
-    def __init__(self, default: str, description: str | None = None, *, enum: Sequence[str] = ()):
-        self.default = default
-        self.enum = tuple(enum)
+    def __post_init__(self):
+        enum = tuple(self.enum)
+        self.enum = _ENUM_CACHE.setdefault(enum, enum)
 
 
 class Server:
@@ -24,8 +32,10 @@ class Server:
 
     https://swagger.io/docs/specification/v3_0/api-host-and-base-path/
     """
+    __slots__ = ("url", "description", "variables")
     url: str
     description: str
+    variables: Mapping[str, ServerVariable]
 
     def __init__(self, url: str, description: str | None = None, **variables: ServerVariable):
         # TODO: validate url to check it does not have URL query parameters
@@ -33,3 +43,6 @@ class Server:
         self.description = description
         # TODO: validate url against declared variables
         self.variables = variables
+
+    def __repr__(self) -> str:
+        return format_fields(self, self.__slots__)
@@ -0,0 +1,48 @@
+# Unit tests for the API base helpers
+import unittest
+
+from campus.api import base
+
+VALID_BASE_URLS = [
+    "https://api.campus.nyjc.dev",
+    "http://a-b.example.com/",
+    "example.com/v1/users",
+    "https://1.example.io/a b",
+]
+INVALID_BASE_URLS = [
+    "",
+    "localhost",
+    "https://",
+    "https://.com",
+    "https://a..com",
+    "https://a.c",
+    "https://a.c0m",
+    "https://a_b.com",
+    "https://a.com:8080",
+    "ftp://a.com",
+    "https://api.campus.dev\n",
+    "https://api.campus.dev/v1\n",
+    "https://ａ.com",
+]
+
+class TestValidBaseUrl(unittest.TestCase):
+    def test_valid(self):
+        for value in VALID_BASE_URLS:
+            with self.subTest(value=value):
+                self.assertTrue(base._valid_base_url(value))
+
+    def test_invalid(self):
+        for value in INVALID_BASE_URLS:
+            with self.subTest(value=value):
+                self.assertFalse(base._valid_base_url(value))
+
+    def test_agrees_with_pattern(self):
+        for value in VALID_BASE_URLS + INVALID_BASE_URLS:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    base._valid_base_url(value),
+                    base.BaseUrlPattern.fullmatch(value) is not None,
+                )
+
+if __name__ == '__main__':
+    unittest.main()
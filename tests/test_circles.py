@@ -0,0 +1,47 @@
+# Unit tests for the circles resource
+import unittest
+from unittest import mock
+
+from campus.api import CampusClient, http
+from campus.api.circles import Circles
+
+class TestPaths(unittest.TestCase):
+    def test_members(self):
+        client = CampusClient("https://api.campus.test")
+        circle = Circles(client)["uid-circle-abcd1234"]
+        self.assertEqual(
+            circle.build_path(),
+            "https://api.campus.test/v1/circles/uid-circle-abcd1234",
+        )
+        with mock.patch.object(http, "get", return_value={}) as get:
+            circle.members.list()
+        get.assert_called_once_with(
+            "https://api.campus.test/v1/circles/uid-circle-abcd1234/members"
+        )
+
+class TestIterMembers(unittest.TestCase):
+    def setUp(self):
+        self.client = CampusClient("https://api.campus.test")
+        self.client.on_error = mock.Mock()
+        self.members = Circles(self.client)["uid-circle-abcd1234"].members
+
+    def test_items(self):
+        items = iter([("uid-user-abcd1234", 1)])
+        with mock.patch.object(http, "get_stream", return_value=items):
+            self.assertEqual(
+                list(self.members.iter_members()), [("uid-user-abcd1234", 1)]
+            )
+        self.client.on_error.assert_not_called()
+
+    def test_error_handled(self):
+        error = {"error_code": 404, "message": "Not Found", "details": ""}
+        with mock.patch.object(http, "get_stream", return_value=error):
+            self.assertEqual(list(self.members.iter_members()), [])
+        self.client.on_error.assert_called_once_with(
+            error,
+            "https://api.campus.test/v1/circles/uid-circle-abcd1234/members",
+            "GET",
+        )
+
+if __name__ == '__main__':
+    unittest.main()
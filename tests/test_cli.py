@@ -0,0 +1,70 @@
+# Unit tests for the command line parser
+import unittest
+from unittest import mock
+
+from campus import cli
+from campus.cli import pattern
+
+class TestClassify(unittest.TestCase):
+    def test_tokens(self):
+        for arg, token in (
+            ("name=my-app", "kv"),
+            ("url=a=b", "kv"),
+            ("help", "cmd"),
+            ("version", "cmd"),
+            ("get", "verb"),
+            ("members", "verb"),
+            ("uid-client-abcd1234", "id"),
+            ("clients", "res"),
+        ):
+            with self.subTest(arg=arg):
+                self.assertEqual(pattern.classify(arg), token)
+
+    def test_unrecognised(self):
+        for arg in ("", "=", "name=", "=my-app", "Clients", "c", "uid-client-abcd123",
+                    "uid-client-abcd1234\n", "clients\n"):
+            with self.subTest(arg=arg):
+                self.assertIsNone(pattern.classify(arg))
+
+class TestParser(unittest.TestCase):
+    def parse(self, *args):
+        return cli.Parser(["campus", *args]).parse()
+
+    def test_command_first(self):
+        for command in ("help", "version"):
+            with self.subTest(command=command):
+                with mock.patch.object(cli.Parser, command) as run:
+                    self.assertIsNone(self.parse(command))
+                run.assert_called_once_with()
+
+    def test_command_not_first(self):
+        for command in ("help", "version"):
+            with self.subTest(command=command):
+                with mock.patch.object(cli.Parser, command) as run:
+                    with self.assertRaisesRegex(cli.ParseError, "Unexpected command"):
+                        self.parse("clients", command)
+                run.assert_not_called()
+
+    def test_key_value(self):
+        call = self.parse("users", "new", "name=ann", "email=ann@nyjc.edu.sg")
+        self.assertEqual(call.resource, cli.client.users.new)
+        self.assertEqual(call.params, {"name": "ann", "email": "ann@nyjc.edu.sg"})
+
+    def test_value_with_equals(self):
+        call = self.parse("users", "new", "name=a=b")
+        self.assertEqual(call.params, {"name": "a=b"})
+
+    def test_unrecognised_argument(self):
+        with self.assertRaisesRegex(cli.ParseError, "Unrecognised argument: Clients"):
+            self.parse("Clients")
+
+    def test_unknown_resource(self):
+        with self.assertRaisesRegex(cli.ParseError, "Unknown resource: circles"):
+            self.parse("circles")
+
+    def test_incomplete(self):
+        with self.assertRaisesRegex(cli.ParseError, "Incomplete command"):
+            cli.Parser([]).parse()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# Unit tests for the HTTP calls
+import io
+import json
+import unittest
+from unittest import mock
+
+import requests
+
+from campus.api import http
+from campus.schema.datatypes import CampusID
+
+def make_response(body, status_code=200):
+    response = mock.MagicMock(status_code=status_code, ok=status_code < 400)
+    response.content = json.dumps(body).encode()
+    response.text = response.content.decode()
+    response.reason = "OK" if response.ok else "Error"
+    response.__exit__.return_value = False
+    return response
+
+class TestCallApi(unittest.TestCase):
+    def setUp(self):
+        http.clear_cache()
+        patcher = mock.patch.object(http, "_session")
+        self.session = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_str_subclass_keys(self):
+        self.session.request.return_value = make_response({})
+        member_id = CampusID("uid-circle-abcd1234")
+        http.post("https://api.campus.test/v1/circles", data={member_id: 1, 2: "a"})
+        sent = self.session.request.call_args.kwargs["data"]
+        self.assertEqual(json.loads(sent), {"uid-circle-abcd1234": 1, "2": "a"})
+
+class TestGetCache(unittest.TestCase):
+    url = "https://api.campus.test/v1/circles/uid-circle-abcd1234"
+
+    def setUp(self):
+        http.clear_cache()
+        patcher = mock.patch.object(http, "_session")
+        self.session = patcher.start()
+        self.addCleanup(patcher.stop)
+        clock = mock.patch.object(http.time, "monotonic", return_value=100.0)
+        self.monotonic = clock.start()
+        self.addCleanup(clock.stop)
+        self.session.request.return_value = make_response({"name": "a"})
+
+    def test_hit_within_ttl(self):
+        self.assertEqual(http.get(self.url), {"name": "a"})
+        self.monotonic.return_value = 104.0
+        self.assertEqual(http.get(self.url), {"name": "a"})
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_hit_returns_copy(self):
+        http.get(self.url)["name"] = "changed"
+        self.assertEqual(http.get(self.url), {"name": "a"})
+        self.assertIsNot(http.get(self.url), http.get(self.url))
+
+    def test_refetch_after_ttl(self):
+        http.get(self.url)
+        self.monotonic.return_value = 105.0
+        self.session.request.return_value = make_response({"name": "b"})
+        self.assertEqual(http.get(self.url), {"name": "b"})
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_policy_by_suffix(self):
+        url = f"{self.url}/members"
+        http.get(url)
+        self.monotonic.return_value = 109.0
+        http.get(url)
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_policy_none_bypasses_cache(self):
+        http.get(self.url, cache="none")
+        http.get(self.url, cache="none")
+        self.assertEqual(self.session.request.call_count, 2)
+        self.assertNotIn(self.url, http._cache)
+
+    def test_errors_not_cached(self):
+        self.session.request.return_value = make_response({}, status_code=404)
+        self.assertEqual(http.get(self.url)["error_code"], 404)
+        self.assertNotIn(self.url, http._cache)
+
+    def test_write_invalidates_related_urls(self):
+        parent = "https://api.campus.test/v1/circles"
+        child = f"{self.url}/members"
+        other = "https://api.campus.test/v1/users"
+        for url in (parent, self.url, child, other):
+            http.get(url)
+        http.patch(self.url, data={"name": "b"})
+        self.assertEqual(list(http._cache), [other])
+
+    def test_stale_on_connection_error(self):
+        http.get(self.url)
+        self.monotonic.return_value = 200.0
+        self.session.request.side_effect = requests.ConnectionError()
+        self.assertEqual(http.get(self.url), {"name": "a"})
+
+    def test_stale_returns_copy(self):
+        http.get(self.url)
+        self.monotonic.return_value = 200.0
+        self.session.request.side_effect = requests.ConnectionError()
+        http.get(self.url)["name"] = "changed"
+        self.assertEqual(http.get(self.url), {"name": "a"})
+
+    def test_stale_on_unavailable(self):
+        http.get(self.url)
+        self.monotonic.return_value = 200.0
+        self.session.request.return_value = make_response({}, status_code=503)
+        self.assertEqual(http.get(self.url), {"name": "a"})
+
+    def test_connection_error_without_cache(self):
+        self.session.request.side_effect = requests.ConnectionError()
+        with self.assertRaises(requests.ConnectionError):
+            http.get(self.url)
+
+class TestGetStream(unittest.TestCase):
+    url = "https://api.campus.test/v1/circles/uid-circle-abcd1234/members"
+
+    def setUp(self):
+        patcher = mock.patch.object(http, "_session")
+        self.session = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_items(self):
+        response = make_response({"data": {"uid-user-abcd1234": 1}})
+        response.raw = io.BytesIO(response.content)
+        self.session.get.return_value = response
+        self.assertEqual(
+            list(http.get_stream(self.url, "data")), [("uid-user-abcd1234", 1)]
+        )
+        response.__exit__.assert_called_once()
+
+    def test_error_dict(self):
+        response = make_response({}, status_code=404)
+        self.session.get.return_value = response
+        self.assertEqual(http.get_stream(self.url)["error_code"], 404)
+        response.__exit__.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
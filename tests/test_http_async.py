@@ -0,0 +1,69 @@
+# Unit tests for the async HTTP calls
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from campus.api import http, http_async
+
+class EchoHandler(BaseHTTPRequestHandler):
+    # Keep connections alive, so a client reused across loops is caught
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+class TestHttpAsync(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_get_in_consecutive_event_loops(self):
+        first = asyncio.run(http_async.get(f"{self.url}/a"))
+        second = asyncio.run(http_async.get(f"{self.url}/b"))
+        self.assertEqual(first, {"path": "/a"})
+        self.assertEqual(second, {"path": "/b"})
+
+    def test_overlapping_gathers(self):
+        async def main():
+            return await asyncio.gather(
+                http_async.gather(http_async.get(f"{self.url}/a")),
+                http_async.gather(http_async.get(f"{self.url}/b")),
+            )
+        self.assertEqual(
+            http_async.run(main()),
+            [[{"path": "/a"}], [{"path": "/b"}]],
+        )
+        self.assertEqual(
+            http_async.run(http_async.gather(http_async.get(f"{self.url}/c"))),
+            [{"path": "/c"}],
+        )
+    def test_write_invalidates_cached_get(self):
+        url = f"{self.url}/users"
+        http.get(url)
+        self.assertIn(url, http._cache)
+        http_async.run(http_async.post(url, data={"name": "a"}))
+        self.assertNotIn(url, http._cache)
+
+if __name__ == '__main__':
+    unittest.main()
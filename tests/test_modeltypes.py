@@ -0,0 +1,97 @@
+# Unit tests for the Campus API model types
+import unittest
+
+from campus.schema.datatypes import CampusLabel, Datetime
+from campus.schema.modeltypes import CampusModel, Circle, Client
+
+CLIENT_JSON = {
+    "id": "uid-client-abcd1234",
+    "name": "my-app",
+    "description": "A test client",
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+class TestInit(unittest.TestCase):
+    def test_fields_cast(self):
+        client = Client(name="my-app", description="A test client")
+        self.assertEqual(client, {"name": "my-app", "description": "A test client"})
+        self.assertIsInstance(client["name"], CampusLabel)
+        self.assertEqual(client.name, "my-app")
+
+    def test_repr(self):
+        client = Client(name="my-app", description="A test client")
+        self.assertEqual(
+            repr(client), "Client(name='my-app', description='A test client')"
+        )
+
+    def test_missing_field(self):
+        with self.assertRaisesRegex(KeyError, "Missing fields"):
+            Client(name="my-app")
+
+    def test_invalid_field(self):
+        with self.assertRaisesRegex(KeyError, "Invalid fields"):
+            Client(name="my-app", description="d", colour="red")
+
+    def test_hidden_field(self):
+        with self.assertRaisesRegex(KeyError, "secret_hash is hidden"):
+            Client(name="my-app", description="d", secret_hash="c2VjcmV0")
+
+    def test_response_only_field(self):
+        with self.assertRaisesRegex(KeyError, "id is response-only"):
+            Client(name="my-app", description="d", id="uid-client-abcd1234")
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            Client(name="My App", description="d")
+
+    def test_subclass(self):
+        class Event(CampusModel):
+            __slots__ = ()
+            __response_only__ = ("created_at",)
+            name: CampusLabel
+            created_at: Datetime
+
+        self.assertEqual(Event(name="open-day"), {"name": "open-day"})
+        self.assertEqual(Event.__init__.__qualname__, f"{Event.__qualname__}.__init__")
+        with self.assertRaises(KeyError):
+            Event(name="open-day", created_at="2024-01-01T00:00:00Z")
+
+    def test_required_response_only_rejected(self):
+        with self.assertRaisesRegex(TypeError, "required and response-only"):
+            class Broken(CampusModel):
+                __slots__ = ()
+                __required__ = ("id",)
+                __response_only__ = ("id",)
+                id: CampusLabel
+
+class TestFromDict(unittest.TestCase):
+    def test_round_trip(self):
+        client = Client.from_dict(CLIENT_JSON)
+        self.assertIsInstance(client, Client)
+        self.assertIsInstance(client["created_at"], Datetime)
+        self.assertEqual(client.as_json(), CLIENT_JSON)
+
+    def test_partial(self):
+        client = Client.from_dict({"name": "my-app"})
+        self.assertEqual(client.as_json(), {"name": "my-app"})
+        with self.assertRaises(AttributeError):
+            client.description
+
+    def test_hidden_field(self):
+        with self.assertRaisesRegex(KeyError, "Invalid fields"):
+            Client.from_dict({**CLIENT_JSON, "secret_hash": "c2VjcmV0"})
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            Client.from_dict({**CLIENT_JSON, "name": "My App"})
+
+    def test_json_object_field(self):
+        circle = Circle.from_dict({
+            "name": "year-one",
+            "tag": "cohort",
+            "members": {"uid-user-abcd1234": 1},
+        })
+        self.assertEqual(circle.as_json()["members"], {"uid-user-abcd1234": 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# Unit tests for the OpenAPI schema datatypes
+import inspect
+import re
+import unittest
+from unittest import mock
+
+from openapi.schema import datatypes
+
+class TestSerialize(unittest.TestCase):
+    def test_extras_on_copy(self):
+        name = datatypes.String(pattern="^[a-z]+$")
+        schema = datatypes.Object(
+            {"id": name, "name": name, "secret": name},
+            readOnly=["id"],
+            writeOnly=["secret"],
+        )
+        properties = schema.to_json()["properties"]
+        self.assertEqual(
+            properties["id"],
+            {"type": "string", "pattern": "^[a-z]+$", "readOnly": True},
+        )
+        self.assertEqual(
+            properties["secret"],
+            {"type": "string", "pattern": "^[a-z]+$", "writeOnly": True},
+        )
+        self.assertIs(properties["name"], name.to_json())
+        self.assertEqual(name.to_json(), {"type": "string", "pattern": "^[a-z]+$"})
+
+    def test_cache_published_once(self):
+        schema = datatypes.Array(datatypes.Array(datatypes.String()))
+        self.assertFalse(hasattr(schema, "_json_cache"))
+        json_ = schema.to_json()
+        self.assertIsInstance(schema._json_cache, tuple)
+        self.assertEqual(len(schema._json_cache), 1)
+        self.assertIs(schema.to_json(), json_)
+        self.assertIs(json_["items"], schema.items.to_json())
+
+    def test_no_cache_after_failed_build(self):
+        class Broken(datatypes.Schema):
+            __slots__ = ()
+
+            def _build_shell(self):
+                raise RuntimeError("cannot build")
+
+        schema = datatypes.Array(datatypes.Array(Broken()))
+        with self.assertRaises(RuntimeError):
+            schema.to_json()
+        self.assertFalse(hasattr(schema, "_json_cache"))
+        self.assertFalse(hasattr(schema.items, "_json_cache"))
+
+    def test_shared_node_built_once(self):
+        shared = datatypes.Array(datatypes.String())
+        schema = datatypes.AllOf(shared, shared)
+        with mock.patch.object(
+            datatypes.Array, "_build_shell", autospec=True,
+            side_effect=datatypes.Array._build_shell,
+        ) as build_shell:
+            json_ = schema.to_json()
+        self.assertEqual(build_shell.call_count, 1)
+        self.assertIs(json_["allOf"][0], json_["allOf"][1])
+
+    def test_deep_nesting(self):
+        schema = datatypes.String()
+        for _ in range(5000):
+            schema = datatypes.Array(schema)
+        json_ = schema.to_json()
+        for _ in range(5000):
+            json_ = json_["items"]
+        self.assertEqual(json_, {"type": "string"})
+
+class TestDatatypesModule(unittest.TestCase):
+    def test_array_takes_items(self):
+        params = inspect.signature(datatypes.Array.__init__).parameters
+        self.assertIn("items", params)
+
+    def test_single_array_definition(self):
+        source = inspect.getsource(datatypes)
+        self.assertEqual(len(re.findall(r"^class Array\b", source, re.M)), 1)
+
+class TestBasicSchema(unittest.TestCase):
+    def test_nullable_in_json(self):
+        for schema in (
+            datatypes.String(nullable=True),
+            datatypes.Number(nullable=True),
+            datatypes.Integer(nullable=True),
+            datatypes.Boolean(nullable=True),
+            datatypes.Date(nullable=True),
+        ):
+            self.assertIs(schema.to_json()["nullable"], True)
+
+    def test_nullable_omitted_by_default(self):
+        self.assertEqual(datatypes.String().to_json(), {"type": "string"})
+
+class TestRepr(unittest.TestCase):
+    def test_fields_skip_none(self):
+        self.assertEqual(
+            repr(datatypes.Array(datatypes.STRING, minItems=1)),
+            "Array(items=String(), minItems=1)",
+        )
+
+    def test_long_combinator_shows_types(self):
+        schema = datatypes.AnyOf(*[datatypes.Array(datatypes.STRING)] * 9)
+        self.assertEqual(repr(schema), "AnyOf(" + ", ".join(["Array"] * 9) + ")")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# Unit tests for the Campus data types
+import unittest
+
+from campus.schema import datatypes
+
+LONG_WORD = "a" * 16
+# Arabic-Indic three, and fullwidth 'a'
+NON_ASCII_DIGIT = "\u0663"
+NON_ASCII_LETTER = "\uff41"
+
+# Valid and invalid values for each hand-written validator
+CASES = {
+    datatypes.UserID: (
+        ["a", "john.doe", "J_Doe-99", "x" * 64],
+        ["", "x" * 65, "john doe", "john@doe", "john\n", f"jo{NON_ASCII_LETTER}"],
+    ),
+    datatypes.Domain: (
+        ["nyjc.edu.sg", "a-b.io", "x.co", "1.2.com"],
+        ["com", ".com", "nyjc.c", "nyjc.c0m", "ny jc.com", "nyjc.com\n",
+         f"nyjc.{NON_ASCII_LETTER}{NON_ASCII_LETTER}", "nyjc_sg.com"],
+    ),
+    datatypes.EmailAddress: (
+        ["john.doe@nyjc.edu.sg", "a@b.co"],
+        ["john.doe", "@nyjc.edu.sg", "john@", "john@doe@nyjc.sg",
+         "john@nyjc.sg\n", "john\n@nyjc.sg", "john doe@nyjc.sg"],
+    ),
+    datatypes.UID: (
+        ["abcd1234", "0000zzzz", "abcdefgh12345678"],
+        ["", "abcd123", "abcd12345", "ABCD1234", "abcd-234", "abcd1234\n",
+         f"abcd123{NON_ASCII_DIGIT}"],
+    ),
+    datatypes.CampusID: (
+        ["uid-client-abcd1234", "uid-circle-0000zzzz", "uid-ab-cd-ef-a1b2c3d4"],
+        ["uid-client-abcd123", "uid-a-abcd1234", "uid-ab-cd-ef-gh-abcd1234",
+         f"uid-{LONG_WORD}-abcd1234", "uid-Client-abcd1234", "uidx-client-abcd1234",
+         "uid-client_abcd1234", "uid-client-abcd1234\n",
+         f"uid-client-abcd123{NON_ASCII_DIGIT}", "uid--abcd1234"],
+    ),
+    datatypes.ClientID: (
+        ["uid-client-abcd1234"],
+        ["uid-circle-abcd1234", "uid-client-abcd12345", "uid-client-abcd1234\n"],
+    ),
+    datatypes.CircleID: (
+        ["uid-circle-abcd1234"],
+        ["uid-client-abcd1234", "uid-circle-ABCD1234"],
+    ),
+    datatypes.CampusLabel: (
+        ["ab", "my-app", "one-two-three", "a" * 15],
+        ["", "a", LONG_WORD, "one-two-three-four", "my--app", "-app", "my-app-",
+         "My-app", "my_app", "app1", "my-app\n", f"a{NON_ASCII_LETTER}"],
+    ),
+    datatypes.OTP: (
+        ["123456", "000000"],
+        ["12345", "1234567", "12345a", "123456\n", f"12345{NON_ASCII_DIGIT}",
+         "\uff11" * 6],
+    ),
+}
+
+class TestValidators(unittest.TestCase):
+    def test_valid(self):
+        for cls, (valid, _) in CASES.items():
+            for value in valid:
+                with self.subTest(cls=cls.__name__, value=value):
+                    cls.validate(value)
+
+    def test_invalid(self):
+        for cls, (_, invalid) in CASES.items():
+            for value in invalid:
+                with self.subTest(cls=cls.__name__, value=value):
+                    with self.assertRaises(ValueError):
+                        cls.validate(value)
+
+    def test_agrees_with_pattern(self):
+        # The validators replace matching the pattern against the whole value
+        for cls, (valid, invalid) in CASES.items():
+            for value in valid + invalid:
+                with self.subTest(cls=cls.__name__, value=value):
+                    expected = cls.pattern.fullmatch(value) is not None
+                    try:
+                        cls.validate(value)
+                    except ValueError:
+                        self.assertFalse(expected)
+                    else:
+                        self.assertTrue(expected)
+
+    def test_error_names_pattern(self):
+        with self.assertRaisesRegex(ValueError, "does not match pattern.*: ABCD1234"):
+            datatypes.UID.validate("ABCD1234")
+
+    def test_email_parts(self):
+        email = datatypes.EmailAddress("john.doe@nyjc.edu.sg")
+        self.assertIsInstance(email.user_id, datatypes.UserID)
+        self.assertEqual((email.user_id, email.domain), ("john.doe", "nyjc.edu.sg"))
+
+    def test_campus_id_parts(self):
+        campus_id = datatypes.CampusID("uid-ab-cd-a1b2c3d4")
+        self.assertEqual((campus_id.label, campus_id.uid), ("ab-cd", "a1b2c3d4"))
+
+class TestUid8Batch(unittest.TestCase):
+    def test_all_valid(self):
+        values = ["abcd1234", "0000zzzz", "a1b2c3d4"]
+        self.assertEqual(datatypes.is_uid8_batch(values), [True, True, True])
+
+    def test_mixed(self):
+        values = ["abcd1234", "ABCD1234", "abcd123", "abcd123٣", "abcd12345"]
+        self.assertEqual(
+            datatypes.is_uid8_batch(values),
+            [True, False, False, False, False],
+        )
+
+    def test_lengths_checked_per_value(self):
+        # The joined values are 16 valid characters, split unevenly
+        self.assertEqual(
+            datatypes.is_uid8_batch(["abcd", "abcd1234abcd"]), [False, False]
+        )
+
+    def test_empty(self):
+        self.assertEqual(datatypes.is_uid8_batch([]), [])
+
+class TestValidateMany(unittest.TestCase):
+    def test_all_valid(self):
+        datatypes.CampusID.validate_many(
+            ["uid-client-abcd1234", "uid-circle-0000zzzz", "uid-user-a1b2c3d4"]
+        )
+        datatypes.ClientID.validate_many(["uid-client-abcd1234"])
+        datatypes.CampusID.validate_many([])
+
+    def test_invalid_value(self):
+        with self.assertRaisesRegex(ValueError, "uid-circle-abcd1234"):
+            datatypes.ClientID.validate_many(
+                ["uid-client-abcd1234", "uid-circle-abcd1234"]
+            )
+
+    def test_trailing_newline(self):
+        with self.assertRaises(ValueError):
+            datatypes.CampusID.validate_many(
+                ["uid-client-abcd1234", "uid-client-abcd1234\n"]
+            )
+
+    def test_value_with_newline(self):
+        # Two valid IDs joined by a newline are not one valid ID
+        with self.assertRaises(ValueError):
+            datatypes.CampusID.validate_many(
+                ["uid-client-abcd1234\nuid-client-abcd1234", "uid-client-abcd1234"]
+            )
+
+if __name__ == '__main__':
+    unittest.main()
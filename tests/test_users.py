@@ -0,0 +1,46 @@
+# Unit tests for the users resource
+import unittest
+from unittest import mock
+
+from campus.api import CampusClient, http_async
+
+ERROR = {"error_code": 409, "message": "Conflict", "details": ""}
+
+class TestPaths(unittest.TestCase):
+    def test_user(self):
+        client = CampusClient("https://api.campus.test")
+        self.assertEqual(
+            client.users["john.doe"].build_path(),
+            "https://api.campus.test/v1/users/john.doe",
+        )
+
+class TestNewMany(unittest.TestCase):
+    def setUp(self):
+        self.client = CampusClient("https://api.campus.test")
+        self.client.on_error = mock.Mock()
+
+    def test_failed_posts_return_none(self):
+        async def post(url, data=None):
+            return ERROR if data["name"] == "taken" else data
+
+        items = [
+            {"name": "ann", "email": "ann@campus.test"},
+            {"name": "taken", "email": "taken@campus.test"},
+        ]
+        with mock.patch.object(http_async, "post", post):
+            users = self.client.users.new_many(items)
+        self.assertEqual(users[0], items[0])
+        self.assertIsNone(users[1])
+        self.client.on_error.assert_called_once_with(
+            ERROR, "https://api.campus.test/v1/users", "POST"
+        )
+
+    def test_invalid_user_sends_nothing(self):
+        post = mock.AsyncMock()
+        with mock.patch.object(http_async, "post", post):
+            with self.assertRaises(ValueError):
+                self.client.users.new_many([{"name": "ann", "email": "ann"}])
+        post.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()